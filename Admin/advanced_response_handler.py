@@ -17,7 +17,8 @@ import queue
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Set
-from datetime import datetime
+
+from .timestamps import now_hms
 
 
 class ResponseState(Enum):
@@ -336,11 +337,11 @@ class AdvancedResponseHandler:
                     self.app.sysinfo_requested = False
 
                 # Update UI
-                self.app.root.after_idle(self.app.update_content_area)
+                self.app.schedule_content_update()
                 self.app.update_cache_status("Fresh data loaded")
 
                 # Log success
-                timestamp = datetime.now().strftime('%H:%M:%S')
+                timestamp = now_hms()
                 self.app.log_data.append(
                     f"[{timestamp}] Advanced handler processed '{command}' "
                     f"({fragments} fragments, {len(content)} chars)"
@@ -365,7 +366,7 @@ class AdvancedResponseHandler:
                 self.app.show_loading_message(f"Error processing {command}: {e}")
 
                 # Log error
-                timestamp = datetime.now().strftime('%H:%M:%S')
+                timestamp = now_hms()
                 self.app.log_data.append(f"[{timestamp}] Error processing '{command}': {e}")
 
                 # Clean up failed buffer
@@ -452,7 +453,7 @@ class AdvancedResponseHandler:
                     self.app.update_cache_status("Request timed out")
 
                     # Log timeout
-                    timestamp = datetime.now().strftime('%H:%M:%S')
+                    timestamp = now_hms()
                     self.app.log_data.append(f"[{timestamp}] '{command}' timed out after {age:.1f}s")
 
                     # Clean up
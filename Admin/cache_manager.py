@@ -10,11 +10,18 @@ import json
 import os
 import time
 import threading
+import weakref
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 import tempfile
-from debug_config import debug, cache_debug, log_info, log_error, log_debug, log_warning
+from debug_config import debug, DebugLevel, cache_debug, log_info, log_error, log_debug, log_warning
+
+# How long a get_stats() snapshot may be reused before it is recomputed
+STATS_TTL = 0.5
+
+# Write buffer for debug exports, so per-entry lines reach the OS in large chunks
+EXPORT_BUFFER_SIZE = 1 << 20
 
 @dataclass
 class CacheEntry:
@@ -33,6 +40,30 @@ class CacheEntry:
         return time.time() - self.timestamp
 
 
+def _cache_debug_enabled() -> bool:
+    """Check whether cache_debug output would be emitted, so hot paths can skip formatting"""
+    return debug.should_log(DebugLevel.DEBUG, 'cache_manager')
+
+
+# Every live cache is swept by one shared cleanup thread
+_cleanup_caches = weakref.WeakSet()
+_cleanup_lock = threading.Lock()
+_cleanup_thread = None
+
+
+def _cleanup_worker():
+    """Periodically remove expired entries from every registered cache"""
+    while True:
+        time.sleep(300)  # Run cleanup every 5 minutes
+        for cache in list(_cleanup_caches):
+            try:
+                removed = cache.cleanup_expired()
+                if removed > 0:
+                    print(f"Cache cleanup: removed {removed} expired entries")
+            except Exception as e:
+                print(f"Cache cleanup error: {e}")
+
+
 class DeviceDataCache:
     """
     Thread-safe cache manager for device data with JSON persistence
@@ -64,6 +95,9 @@ class DeviceDataCache:
         # In-memory cache for fast access
         self._memory_cache: Dict[str, CacheEntry] = {}
 
+        # Short-lived get_stats() snapshot: (monotonic timestamp, stats)
+        self._stats_snapshot: Optional[tuple] = None
+
         # Cache file paths
         self.cache_file = os.path.join(self.cache_dir, "device_cache.json")
         self.metadata_file = os.path.join(self.cache_dir, "cache_metadata.json")
@@ -126,6 +160,9 @@ class DeviceDataCache:
         """ENHANCED: Save cache to JSON file with debug logging"""
         cache_debug("Saving cache to file", "SAVE_START")
 
+        # Every mutation persists through here, so drop the stats snapshot
+        self._stats_snapshot = None
+
         try:
             # Convert cache entries to serializable format
             cache_data = {}
@@ -146,10 +183,13 @@ class DeviceDataCache:
 
             cache_debug(f"Preparing to save {saved_count} entries, skipping {expired_count} expired", "SAVE_PREP")
 
+            # Encode compactly in one pass; the file is only read back by _load_cache
+            payload = json.dumps(cache_data, separators=(',', ':'), default=str).encode('utf-8')
+
             # Write to file atomically
             temp_file = self.cache_file + '.tmp'
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, default=str)
+            with open(temp_file, 'wb') as f:
+                f.write(payload)
 
             cache_debug(f"Written cache data to temp file: {temp_file}", "TEMP_WRITTEN")
 
@@ -164,7 +204,7 @@ class DeviceDataCache:
             cache_debug(f"Cache file updated: {self.cache_file}", "FILE_UPDATED")
 
             # Save metadata
-            file_size = os.path.getsize(self.cache_file) if os.path.exists(self.cache_file) else 0
+            file_size = len(payload)
             metadata = {
                 'last_save': time.time(),
                 'entry_count': len(cache_data),
@@ -172,7 +212,7 @@ class DeviceDataCache:
             }
 
             with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+                f.write(json.dumps(metadata, separators=(',', ':')))
 
             cache_debug(f"Cache save complete: {saved_count} entries, {file_size} bytes", "SAVE_COMPLETE")
 
@@ -187,8 +227,10 @@ class DeviceDataCache:
         if ttl is None:
             ttl = self.default_ttl
 
-        cache_debug(f"Setting cache entry: {key}", "SET_START")
-        cache_debug(f"Command: {command}, TTL: {ttl}s", "SET_PARAMS")
+        debug_on = _cache_debug_enabled()
+        if debug_on:
+            cache_debug(f"Setting cache entry: {key}", "SET_START")
+            cache_debug(f"Command: {command}, TTL: {ttl}s", "SET_PARAMS")
 
         expires_at = time.time() + ttl
 
@@ -204,58 +246,69 @@ class DeviceDataCache:
             is_update = key in self._memory_cache
             self._memory_cache[key] = entry
 
-            cache_debug(f"Cache entry {'updated' if is_update else 'created'}: {key}", "SET_STORED")
+            if debug_on:
+                cache_debug(f"Cache entry {'updated' if is_update else 'created'}: {key}", "SET_STORED")
 
             # Save to file
             self._save_cache()
 
-            cache_debug(f"Cache set complete for: {key}", "SET_COMPLETE")
+            if debug_on:
+                cache_debug(f"Cache set complete for: {key}", "SET_COMPLETE")
 
     def get(self, key: str) -> Optional[Any]:
         """
         ENHANCED: Retrieve data from cache with debug logging
         """
-        cache_debug(f"Getting cache entry: {key}", "GET_START")
+        debug_on = _cache_debug_enabled()
+        if debug_on:
+            cache_debug(f"Getting cache entry: {key}", "GET_START")
 
         with self._lock:
             entry = self._memory_cache.get(key)
 
             if entry is None:
-                cache_debug(f"Cache miss: {key}", "CACHE_MISS")
+                if debug_on:
+                    cache_debug(f"Cache miss: {key}", "CACHE_MISS")
                 return None
 
             if entry.is_expired():
-                cache_debug(f"Cache entry expired: {key}", "CACHE_EXPIRED")
+                if debug_on:
+                    cache_debug(f"Cache entry expired: {key}", "CACHE_EXPIRED")
                 # Remove expired entry
                 del self._memory_cache[key]
                 self._save_cache()
                 return None
 
-            age = entry.age_seconds()
-            cache_debug(f"Cache hit: {key} (age: {age:.1f}s)", "CACHE_HIT")
+            if debug_on:
+                cache_debug(f"Cache hit: {key} (age: {entry.age_seconds():.1f}s)", "CACHE_HIT")
             return entry.data
 
     def get_with_metadata(self, key: str) -> Optional[Dict[str, Any]]:
         """
         ENHANCED: Retrieve data with metadata from cache with debug logging
         """
-        cache_debug(f"Getting cache entry with metadata: {key}", "META_GET")
+        debug_on = _cache_debug_enabled()
+        if debug_on:
+            cache_debug(f"Getting cache entry with metadata: {key}", "META_GET")
 
         with self._lock:
             entry = self._memory_cache.get(key)
 
             if entry is None:
-                cache_debug(f"Cache miss (metadata): {key}", "META_MISS")
+                if debug_on:
+                    cache_debug(f"Cache miss (metadata): {key}", "META_MISS")
                 return None
 
             if entry.is_expired():
-                cache_debug(f"Cache entry expired (metadata): {key}", "META_EXPIRED")
+                if debug_on:
+                    cache_debug(f"Cache entry expired (metadata): {key}", "META_EXPIRED")
                 del self._memory_cache[key]
                 self._save_cache()
                 return None
 
             age = entry.age_seconds()
-            cache_debug(f"Cache hit (metadata): {key} (age: {age:.1f}s)", "META_HIT")
+            if debug_on:
+                cache_debug(f"Cache hit (metadata): {key} (age: {age:.1f}s)", "META_HIT")
 
             return {
                 'data': entry.data,
@@ -501,7 +554,7 @@ class DeviceDataCache:
         cache_debug(f"Exporting cache debug info to: {filepath}", "DEBUG_EXPORT")
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 f.write("CalypsoPy Cache Debug Information\n")
                 f.write("=" * 50 + "\n")
                 f.write(f"Generated: {datetime.now().isoformat()}\n")
@@ -519,28 +572,27 @@ class DeviceDataCache:
 
                 if health['issues']:
                     f.write("\nISSUES:\n")
-                    for issue in health['issues']:
-                        f.write(f"  - {issue}\n")
+                    f.writelines(f"  - {issue}\n" for issue in health['issues'])
 
                 if health['recommendations']:
                     f.write("\nRECOMMENDATIONS:\n")
-                    for rec in health['recommendations']:
-                        f.write(f"  - {rec}\n")
+                    f.writelines(f"  - {rec}\n" for rec in health['recommendations'])
 
                 # Detailed statistics
                 f.write("\n\nDETAILED STATISTICS\n")
                 f.write("-" * 30 + "\n")
                 stats = health['statistics']
-                for key, value in stats.items():
-                    f.write(f"{key}: {value}\n")
+                f.writelines(f"{key}: {value}\n" for key, value in stats.items())
 
                 # Entry list
                 f.write("\n\nCACHE ENTRIES\n")
                 f.write("-" * 20 + "\n")
                 entries = self.get_entry_list()
-                for entry in entries:
-                    status = "EXPIRED" if entry['expired'] else "VALID"
-                    f.write(f"{entry['key']:<30} {status:<8} {entry['age_seconds']:.1f}s {entry['command']}\n")
+                f.writelines(
+                    f"{entry['key']:<30} {'EXPIRED' if entry['expired'] else 'VALID':<8} "
+                    f"{entry['age_seconds']:.1f}s {entry['command']}\n"
+                    for entry in entries
+                )
 
             cache_debug(f"Debug info exported successfully to: {filepath}", "EXPORT_SUCCESS")
             return filepath
@@ -576,8 +628,13 @@ class DeviceDataCache:
         return removed_count
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics"""
+        """Get cache statistics (reused for up to STATS_TTL seconds)"""
         with self._lock:
+            snapshot = self._stats_snapshot
+            now = time.monotonic()
+            if snapshot is not None and now - snapshot[0] < STATS_TTL:
+                return dict(snapshot[1])
+
             total_entries = len(self._memory_cache)
             expired_entries = sum(1 for entry in self._memory_cache.values() if entry.is_expired())
 
@@ -589,7 +646,7 @@ class DeviceDataCache:
             except:
                 pass
 
-            return {
+            stats = {
                 'total_entries': total_entries,
                 'expired_entries': expired_entries,
                 'valid_entries': total_entries - expired_entries,
@@ -597,6 +654,8 @@ class DeviceDataCache:
                 'cache_directory': self.cache_dir,
                 'default_ttl': self.default_ttl
             }
+            self._stats_snapshot = (now, stats)
+            return dict(stats)
 
     def get_entry_list(self) -> list:
         """Get list of all cache entries with metadata"""
@@ -618,20 +677,14 @@ class DeviceDataCache:
             return entries
 
     def _start_cleanup_thread(self):
-        """Start background thread for periodic cleanup"""
-
-        def cleanup_worker():
-            while True:
-                try:
-                    time.sleep(300)  # Run cleanup every 5 minutes
-                    removed = self.cleanup_expired()
-                    if removed > 0:
-                        print(f"Cache cleanup: removed {removed} expired entries")
-                except Exception as e:
-                    print(f"Cache cleanup error: {e}")
-
-        cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
-        cleanup_thread.start()
+        """Register with the shared background cleanup thread, starting it once"""
+        global _cleanup_thread
+
+        with _cleanup_lock:
+            _cleanup_caches.add(self)
+            if _cleanup_thread is None:
+                _cleanup_thread = threading.Thread(target=_cleanup_worker, daemon=True)
+                _cleanup_thread.start()
 
 
 class SystemInfoParser:
@@ -32,6 +32,8 @@ class EnhancedSystemInfoParser:
     Enhanced parser with complete method implementation
     """
 
+    __slots__ = ('cache',)
+
     def __init__(self, cache_manager=None):
         self.cache = cache_manager
 
@@ -996,28 +998,28 @@ class EnhancedSystemInfoParser:
 
     def _convert_port_config_to_items(self, config_data: Dict) -> List[Dict]:
         """Convert port config data to displayable items"""
-        items = []
+        ports = config_data.get('ports', {})
+        golden_data = config_data.get('golden_finger')
 
         # Convert ports
-        for port_key, port_data in config_data.get('ports', {}).items():
-            item = {
+        items = [
+            {
                 'label': f"Port {port_data['port_number']}",
                 'value': 'Enabled' if port_data['enabled'] else 'Disabled',
                 'details': f"Speed: {port_data['current_speed']}, {port_data['link_width']}",
                 'config': port_data
             }
-            items.append(item)
+            for port_data in ports.values()
+        ]
 
         # Convert golden finger
-        golden_data = config_data.get('golden_finger', {})
         if golden_data:
-            item = {
+            items.append({
                 'label': 'Golden Finger (Upstream)',
                 'value': 'Enabled' if golden_data['enabled'] else 'Disabled',
                 'details': f"Speed: {golden_data['current_speed']}, {golden_data['link_width']}",
                 'config': golden_data
-            }
-            items.append(item)
+            })
 
         return items
 
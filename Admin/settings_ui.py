@@ -40,7 +40,7 @@ class SettingsDialog:
     """
 
     def __init__(self, parent: tk.Tk, settings_manager: SettingsManager,
-                 on_settings_changed: Callable = None):
+                 on_settings_changed: Callable = None, cache_manager=None):
         """
         Initialize settings dialog
 
@@ -48,10 +48,12 @@ class SettingsDialog:
             parent: Parent window
             settings_manager: Settings manager instance
             on_settings_changed: Callback when settings are changed
+            cache_manager: Device data cache shown on the Cache tab, if connected
         """
         self.parent = parent
         self.settings_mgr = settings_manager
         self.on_settings_changed = on_settings_changed
+        self.cache_manager = cache_manager
 
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
@@ -205,9 +207,10 @@ class SettingsDialog:
         ttk.Label(cache_frame, text="Cache Information",
                   style='SettingsHeader.TLabel').pack(anchor='w', pady=(20, 10))
 
-        self.cache_info_text = tk.Text(cache_frame, height=6, wrap='word',
-                                       state='disabled', bg='#f8f8f8')
-        self.cache_info_text.pack(fill='x', pady=5)
+        # A few short lines - a Label redraws only when its StringVar changes
+        self.cache_info_var = tk.StringVar(value="")
+        ttk.Label(cache_frame, textvariable=self.cache_info_var, style='SettingsLabel.TLabel',
+                  justify='left', anchor='nw').pack(fill='x', pady=5)
 
         # Cache management buttons
         cache_buttons_frame = ttk.Frame(cache_frame)
@@ -595,13 +598,17 @@ class SettingsDialog:
 
     def _update_cache_info(self):
         """Update cache information display"""
-        # This would be implemented to show current cache stats
-        info_text = "Cache information will be displayed here..."
-
-        self.cache_info_text.config(state='normal')
-        self.cache_info_text.delete(1.0, tk.END)
-        self.cache_info_text.insert(1.0, info_text)
-        self.cache_info_text.config(state='disabled')
+        if self.cache_manager:
+            stats = self.cache_manager.get_stats()
+            info_text = (f"Entries: {stats['valid_entries']} valid, {stats['expired_entries']} expired\n"
+                         f"Cache file: {stats['cache_file_size'] / 1024:.1f} KB\n"
+                         f"Location: {stats['cache_directory']}")
+        else:
+            info_text = "Cache information is available once a device is connected."
+
+        # Skip the redraw when the stats have not changed
+        if self.cache_info_var.get() != info_text:
+            self.cache_info_var.set(info_text)
 
     def _browse_cache_directory(self):
         """Browse for cache directory"""
@@ -622,7 +629,8 @@ class SettingsDialog:
         if messagebox.askyesno("Clear Cache",
                                "Are you sure you want to clear all cached data?\n\n"
                                "This action cannot be undone."):
-            # Implementation would clear the cache
+            if self.cache_manager:
+                self.cache_manager.clear()
             messagebox.showinfo("Cache Cleared", "All cached data has been cleared.")
             self._update_cache_info()
 
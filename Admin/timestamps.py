@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+timestamps.py
+
+Shared timestamp formatting for CalypsoPy terminal and log output.
+"""
+
+import time
+
+# Last formatted timestamp as (epoch second, HH:MM:SS); replaced as one tuple so
+# concurrent callers never see a mismatched pair
+_hms_cache = (None, "")
+
+
+def now_hms() -> str:
+    """Return the local time as HH:MM:SS, formatting at most once per second"""
+    global _hms_cache
+    epoch = int(time.time())
+    cached_epoch, text = _hms_cache
+    if epoch != cached_epoch:
+        text = time.strftime('%H:%M:%S', time.localtime(epoch))
+        _hms_cache = (epoch, text)
+    return text
@@ -9,83 +9,150 @@ Includes support for clock, fmode, and other device-specific commands.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-from datetime import datetime
+from collections import deque
+from contextlib import nullcontext
+from functools import lru_cache, partial
+import itertools
+from operator import itemgetter
+import os
+import queue
+import threading
 import time
-from typing import Dict, List, Optional
-
-
-class AdvancedDashboard:
-    """
-    Advanced Dashboard for device command execution and control
-    """
-
-    def __init__(self, parent_app):
-        """
-        Initialize Advanced Dashboard
-
-        Args:
-            parent_app: Reference to main dashboard application
-        """
-        self.app = parent_app
-        self.is_demo_mode = parent_app.is_demo_mode
-        print(f"DEBUG: AdvancedDashboard initialized (Demo Mode: {self.is_demo_mode})")
-
-        # Command history
-        self.command_history = []
-        self.history_index = -1
-        self.max_history = 50
-
-        # Session tracking
-        self.session_start = time.time()
-        self.command_count = 0
-
-        # Command output widget (will be created later)
-        self.command_output = None
-        self.command_entry = None
-
-        # Demo responses for various commands
-        self.demo_responses = self._init_demo_responses()
-
-    def _init_demo_responses(self) -> Dict[str, str]:
-        """Initialize demo mode responses for various commands"""
-        return {
-            # Clock commands
-            'clock': """Cmd>clock
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Optional
+
+from Admin.timestamps import now_hms
+
+# Real-device response collection (seconds)
+RESPONSE_TIMEOUT = 5.0
+RESPONSE_IDLE_TIMEOUT = 0.15
+
+# How long shutdown() waits for the sender thread before closing the wakeup pipe
+SENDER_JOIN_TIMEOUT = 1.0
+
+# Terminal scrollback: checked every TRIM_OUTPUT_LINES new lines and cut back to
+# MAX_OUTPUT_LINES - TRIM_OUTPUT_LINES once it passes MAX_OUTPUT_LINES
+MAX_OUTPUT_LINES = 2000
+TRIM_OUTPUT_LINES = 500
+
+# Terminal writes within this window are coalesced into one insert (milliseconds),
+# unless the queued text reaches OUTPUT_FLUSH_CHARS first
+OUTPUT_FLUSH_MS = 50
+OUTPUT_FLUSH_CHARS = 64 * 1024
+
+# How often the unbuilt command reference checks whether it has been scrolled
+# into view (milliseconds)
+REFERENCE_VIEW_POLL_MS = 250
+
+# Ports that support flit mode
+FMODE_PORTS = ("32", "80", "112", "128")
+
+# Terminal banners
+WELCOME_RULE = "=" * 60
+WELCOME_DEMO = (f"{WELCOME_RULE}\n"
+                "Advanced Command Terminal Ready\n"
+                "🎭 DEMO MODE - Simulated responses enabled\n"
+                "Type 'help' for available commands\n"
+                f"{WELCOME_RULE}\n\n")
+WELCOME_LIVE_TEMPLATE = (f"{WELCOME_RULE}\n"
+                         "Advanced Command Terminal Ready\n"
+                         "🔌 Connected to device on port {port}\n"
+                         "Type 'help' for available commands\n"
+                         f"{WELCOME_RULE}\n\n")
+CLEARED_MESSAGE = "Terminal cleared\nType 'help' for available commands\n\n"
+
+# Quick command button rows: (row label, ((button text, width, command), ...))
+QUICK_COMMAND_ROWS = (
+    (None, (
+        ("📋 Help", 15, "help"),
+        ("📊 System Info", 15, "sysinfo"),
+        ("🔍 Version", 15, "ver"),
+        ("🔌 Show Ports", 15, "showport"),
+        ("⚙️ Show Mode", 15, "showmode"),
+    )),
+    ("Clock:", (
+        ("Status", 10, "clock"),
+        ("Left Enable", 12, "clock l e"),
+        ("Left Disable", 12, "clock l d"),
+        ("SRIS 0.5%", 12, "clock srise5"),
+        ("SRIS Disable", 12, "clock srisd"),
+    )),
+)
+
+# Command reference columns: (title, lines)
+COMMAND_REFERENCE = (
+    ("Clock Commands:", (
+        "clock          - Show clock status",
+        "clock l d      - Disable left MCIO clock",
+        "clock l e      - Enable left MCIO clock",
+        "clock r d      - Disable right MCIO clock",
+        "clock r e      - Enable right MCIO clock",
+        "clock srise5   - Set 0.5% spread",
+        "clock srise2   - Set 0.25% spread",
+        "clock srisd    - Disable spread"
+    )),
+    ("Flit Mode Commands:", (
+        "fmode              - Show flit mode status",
+        "fmode [port] en    - Enable flit mode",
+        "fmode [port] dis   - Disable flit mode",
+        "",
+        "Available ports:",
+        "  32, 80, 112, 128",
+        "",
+        "Example: fmode 32 en"
+    )),
+    ("General Commands:", (
+        "help       - Show all commands",
+        "ver        - Version information",
+        "sysinfo    - System information",
+        "lsd        - System diagnostics",
+        "showport   - Port status",
+        "showmode   - Current mode",
+        "setmode N  - Set mode (0-7)",
+        "reset      - System reset"
+    ))
+)
+
+
+# Demo mode responses keyed by lowercase command, shared read-only by every instance
+DEMO_RESPONSES = MappingProxyType({
+    # Clock commands
+    'clock': """Cmd>clock
 MCIO Left clock disable.
 MCIO Right clock enable.
 Straddle clock enable.
 Cmd>""",
 
-            'clock l d': """Cmd>clock l d
+    'clock l d': """Cmd>clock l d
 Set MCIO Left clock disable success.
 Cmd>""",
 
-            'clock l e': """Cmd>clock l e
+    'clock l e': """Cmd>clock l e
 Set MCIO Left clock enable success.
 Cmd>""",
 
-            'clock r d': """Cmd>clock r d
+    'clock r d': """Cmd>clock r d
 Set MCIO Right clock disable success.
 Cmd>""",
 
-            'clock r e': """Cmd>clock r e
+    'clock r e': """Cmd>clock r e
 Set MCIO Right clock enable success.
 Cmd>""",
 
-            'clock srise5': """Cmd>clock srise5
+    'clock srise5': """Cmd>clock srise5
 Set SRIS Clock mode enable 0.5% success.
 Cmd>""",
 
-            'clock srise2': """Cmd>clock srise2
+    'clock srise2': """Cmd>clock srise2
 Set SRIS Clock mode enable 0.25% success.
 Cmd>""",
 
-            'clock srisd': """Cmd>clock srisd
+    'clock srisd': """Cmd>clock srisd
 Set SRIS Clock mode disable success.
 Cmd>""",
 
-            # Fmode commands
-            'fmode': """Cmd>fmode
+    # Fmode commands
+    'fmode': """Cmd>fmode
 
 Port 32 enable flitmode.
 Port 80 disable flitmode.
@@ -93,56 +160,56 @@ Port 112 enable flitmode.
 Port 128 enable flitmode.
 Cmd>""",
 
-            'fmode 32 en': """Cmd>fmode 32 en
+    'fmode 32 en': """Cmd>fmode 32 en
 
 Write enable Flitmode page success.
 Set enable Flitmode success.
 Cmd>""",
 
-            'fmode 32 dis': """Cmd>fmode 32 dis
+    'fmode 32 dis': """Cmd>fmode 32 dis
 
 Write disable Flitmode page success.
 Set disable Flitmode success.
 Cmd>""",
 
-            'fmode 80 en': """Cmd>fmode 80 en
+    'fmode 80 en': """Cmd>fmode 80 en
 
 Write enable Flitmode page success.
 Set enable Flitmode success.
 Cmd>""",
 
-            'fmode 80 dis': """Cmd>fmode 80 dis
+    'fmode 80 dis': """Cmd>fmode 80 dis
 
 Write disable Flitmode page success.
 Set disable Flitmode success.
 Cmd>""",
 
-            'fmode 112 en': """Cmd>fmode 112 en
+    'fmode 112 en': """Cmd>fmode 112 en
 
 Write enable Flitmode page success.
 Set enable Flitmode success.
 Cmd>""",
 
-            'fmode 112 dis': """Cmd>fmode 112 dis
+    'fmode 112 dis': """Cmd>fmode 112 dis
 
 Write disable Flitmode page success.
 Set disable Flitmode success.
 Cmd>""",
 
-            'fmode 128 en': """Cmd>fmode 128 en
+    'fmode 128 en': """Cmd>fmode 128 en
 
 Write enable Flitmode page success.
 Set enable Flitmode success.
 Cmd>""",
 
-            'fmode 128 dis': """Cmd>fmode 128 dis
+    'fmode 128 dis': """Cmd>fmode 128 dis
 
 Write disable Flitmode page success.
 Set disable Flitmode success.
 Cmd>""",
 
-            # Other common commands
-            'help': """Available Commands:
+    # Other common commands
+    'help': """Available Commands:
 =================
 System Commands:
   help              - Show this help message
@@ -174,7 +241,7 @@ Port Commands:
 
 Cmd>""",
 
-            'ver': """Cmd>ver
+    'ver': """Cmd>ver
 =====================================
 ver
 =====================================
@@ -186,7 +253,7 @@ Build: Aug 19 2025 12:00:00
 SBR Version: 0 34 160 28
 Cmd>""",
 
-            'showport': """Cmd>showport
+    'showport': """Cmd>showport
 
 Port Slot------------------------------------------------------------------------------
 Port32 : speed 06, width 16, max_speed06, max_width16
@@ -199,12 +266,119 @@ Golden finger: speed 05, width 16, max_width = 16
 
 Cmd>""",
 
-            'showmode': """Cmd>showmode
+    'showmode': """Cmd>showmode
 
 SBR mode: 0
 
 Cmd>""",
+})
+
+
+# Single-word demo commands; any command starting with one of these words falls
+# back to that family's base response
+DEMO_FAMILY_RESPONSES = MappingProxyType(
+    {command: response for command, response in DEMO_RESPONSES.items() if ' ' not in command})
+
+
+@lru_cache(maxsize=128)
+def _lookup_demo_response(cmd_lower: str) -> Optional[str]:
+    """Return the demo response for a lowercased command, or None if nothing matches"""
+    # Check for exact match first
+    if cmd_lower in DEMO_RESPONSES:
+        return DEMO_RESPONSES[cmd_lower]
+
+    # A known first word selects its family's base response directly
+    response = DEMO_FAMILY_RESPONSES.get(cmd_lower.split(' ', 1)[0])
+    if response is not None:
+        return response
+
+    # Otherwise look for partial matches across every response
+    for demo_cmd, response in DEMO_RESPONSES.items():
+        if demo_cmd in cmd_lower or cmd_lower in demo_cmd:
+            return response
+    return None
+
+
+class AdvancedDashboard:
+    """
+    Advanced Dashboard for device command execution and control
+    """
+
+    # Demo responses for various commands, shared read-only by every instance
+    demo_responses: Mapping[str, str] = DEMO_RESPONSES
+
+    def __init__(self, parent_app):
+        """
+        Initialize Advanced Dashboard
+
+        Args:
+            parent_app: Reference to main dashboard application
+        """
+        self.app = parent_app
+        self.is_demo_mode = parent_app.is_demo_mode
+        print(f"DEBUG: AdvancedDashboard initialized (Demo Mode: {self.is_demo_mode})")
+
+        # Command history
+        self.max_history = 50
+        self.command_history = deque(maxlen=self.max_history)
+        self._history_set = set()
+        self.history_index = 0
+        self._history_prefix = ""
+
+        # Entry text chosen by history navigation, written once per idle pass
+        self._history_text = ""
+        self._nav_pending = None
+
+        # Session tracking
+        self.session_start = time.time()
+        self.command_count = 0
+
+        # Command output widget (will be created later)
+        self.command_output = None
+
+        # Alternating text/tag segments waiting for the next terminal flush
+        self._pending_output: List[str] = []
+        self._pending_chars = 0
+        self._output_flush_id = None
+
+        # Lines written since the scrollback length was last checked
+        self._lines_since_trim = 0
+        self.command_entry = None
+        self.main_frame = None
+
+        # (batch, callback) exchanges handed to the sender thread, which writes
+        # each batch and collects its reply in order so Tk never blocks on serial
+        self._send_queue = queue.Queue()
+        self._send_thread = None
+
+        # (callback, response) completions from the sender thread, run by Tk; unbounded
+        # so a burst never drops a callback
+        self._completions = deque()
+        self._drain_scheduled = threading.Event()
+
+        # Ends of the pipe that wakes Tk; None means fall back to after(). The lock
+        # keeps the pipe from being closed between reading _wake_w and writing to it
+        self._wake_r = None
+        self._wake_w = None
+        self._wake_lock = threading.Lock()
+        self._wake_checked = False
+
+        # Commands queued by enqueue_command until the next flush_commands
+        self._pending_commands: List[str] = []
+
+        # Execution path is fixed by the connection mode; the send function is
+        # re-resolved only when app.cli is replaced
+        self._run_commands = self._run_demo_commands if self.is_demo_mode else self._run_real_commands
+        self._bound_cli = None
+        self._send_batch = None
+
+        # Dashboard sections in display order; each is built at most once per widget tree
+        self._section_builders = {
+            'quick_commands': self._create_quick_commands_section,
+            'terminal': self._create_command_terminal_section,
+            'reference': self._create_command_reference_section,
         }
+        self._built_sections = set()
 
     def create_advanced_dashboard(self, scrollable_frame):
         """
@@ -215,6 +389,15 @@ Cmd>""",
         """
         print("DEBUG: Creating advanced dashboard content")
 
+        # Reuse the widget tree if it is still alive in this frame
+        if (self.main_frame is not None and self.main_frame.master is scrollable_frame
+                and self.main_frame.winfo_exists()):
+            print("DEBUG: Advanced dashboard already built - reusing widgets")
+            if not self.main_frame.winfo_manager():
+                self.main_frame.pack(fill='both', expand=True, padx=20, pady=20)
+            self.command_entry.focus_set()
+            return
+
         try:
             # Clear existing content
             for widget in scrollable_frame.winfo_children():
@@ -223,6 +406,7 @@ Cmd>""",
             # Main container
             main_frame = ttk.Frame(scrollable_frame, style='Content.TFrame')
             main_frame.pack(fill='both', expand=True, padx=20, pady=20)
+            self.main_frame = main_frame
 
             # Title
             title_frame = ttk.Frame(main_frame, style='Content.TFrame')
@@ -237,10 +421,10 @@ Cmd>""",
                           style='Info.TLabel',
                           foreground='#ff9500').pack(side='left', padx=(20, 0))
 
-            # Create sections
-            self._create_quick_commands_section(main_frame)
-            self._create_command_terminal_section(main_frame)
-            self._create_command_reference_section(main_frame)
+            # Create sections - the reference is only an empty frame until it is scrolled into view
+            self._built_sections = set()
+            for name in self._section_builders:
+                self._ensure_section_built(name)
 
             print("DEBUG: Advanced dashboard created successfully")
 
@@ -250,6 +434,13 @@ Cmd>""",
             traceback.print_exc()
             self._create_error_display(scrollable_frame, str(e))
 
+    def _ensure_section_built(self, name: str):
+        """Build a dashboard section into the current main frame unless it already exists"""
+        if name in self._built_sections or not self.main_frame or not self.main_frame.winfo_exists():
+            return
+        self._built_sections.add(name)
+        self._section_builders[name](self.main_frame)
+
     def _create_quick_commands_section(self, parent):
         """Create quick command buttons section"""
         # Quick commands frame
@@ -261,36 +452,16 @@ Cmd>""",
         button_container = ttk.Frame(quick_frame, style='Content.TFrame')
         button_container.pack(padx=10, pady=10)
 
-        # Row 1: System commands
-        row1 = ttk.Frame(button_container, style='Content.TFrame')
-        row1.pack(fill='x', pady=2)
-
-        ttk.Button(row1, text="📋 Help", width=15,
-                   command=lambda: self._execute_command("help")).pack(side='left', padx=2)
-        ttk.Button(row1, text="📊 System Info", width=15,
-                   command=lambda: self._execute_command("sysinfo")).pack(side='left', padx=2)
-        ttk.Button(row1, text="🔍 Version", width=15,
-                   command=lambda: self._execute_command("ver")).pack(side='left', padx=2)
-        ttk.Button(row1, text="🔌 Show Ports", width=15,
-                   command=lambda: self._execute_command("showport")).pack(side='left', padx=2)
-        ttk.Button(row1, text="⚙️ Show Mode", width=15,
-                   command=lambda: self._execute_command("showmode")).pack(side='left', padx=2)
-
-        # Row 2: Clock commands
-        row2 = ttk.Frame(button_container, style='Content.TFrame')
-        row2.pack(fill='x', pady=2)
-
-        ttk.Label(row2, text="Clock:", style='Info.TLabel').pack(side='left', padx=(0, 10))
-        ttk.Button(row2, text="Status", width=10,
-                   command=lambda: self._execute_command("clock")).pack(side='left', padx=2)
-        ttk.Button(row2, text="Left Enable", width=12,
-                   command=lambda: self._execute_command("clock l e")).pack(side='left', padx=2)
-        ttk.Button(row2, text="Left Disable", width=12,
-                   command=lambda: self._execute_command("clock l d")).pack(side='left', padx=2)
-        ttk.Button(row2, text="SRIS 0.5%", width=12,
-                   command=lambda: self._execute_command("clock srise5")).pack(side='left', padx=2)
-        ttk.Button(row2, text="SRIS Disable", width=12,
-                   command=lambda: self._execute_command("clock srisd")).pack(side='left', padx=2)
+        # System and clock command rows
+        for row_label, buttons in QUICK_COMMAND_ROWS:
+            row = ttk.Frame(button_container, style='Content.TFrame')
+            row.pack(fill='x', pady=2)
+
+            if row_label:
+                ttk.Label(row, text=row_label, style='Info.TLabel').pack(side='left', padx=(0, 10))
+            for text, width, command in buttons:
+                ttk.Button(row, text=text, width=width,
+                           command=partial(self._execute_command, command)).pack(side='left', padx=2)
 
         # Row 3: Fmode commands
         row3 = ttk.Frame(button_container, style='Content.TFrame')
@@ -298,21 +469,23 @@ Cmd>""",
 
         ttk.Label(row3, text="Flit Mode:", style='Info.TLabel').pack(side='left', padx=(0, 10))
         ttk.Button(row3, text="Status", width=10,
-                   command=lambda: self._execute_command("fmode")).pack(side='left', padx=2)
+                   command=partial(self._execute_command, "fmode")).pack(side='left', padx=2)
 
         # Port selection for fmode
         self.fmode_port_var = tk.StringVar(value="32")
         port_combo = ttk.Combobox(row3, textvariable=self.fmode_port_var,
-                                  values=["32", "80", "112", "128"],
+                                  values=FMODE_PORTS,
                                   width=8, state='readonly')
         port_combo.pack(side='left', padx=2)
 
         ttk.Button(row3, text="Enable", width=10,
-                   command=lambda: self._execute_command(f"fmode {self.fmode_port_var.get()} en")).pack(side='left',
-                                                                                                        padx=2)
+                   command=partial(self._execute_fmode, "en")).pack(side='left', padx=2)
         ttk.Button(row3, text="Disable", width=10,
-                   command=lambda: self._execute_command(f"fmode {self.fmode_port_var.get()} dis")).pack(side='left',
-                                                                                                         padx=2)
+                   command=partial(self._execute_fmode, "dis")).pack(side='left', padx=2)
+
+    def _execute_fmode(self, action: str):
+        """Run an fmode enable/disable command for the selected port"""
+        self._execute_command(f"fmode {self.fmode_port_var.get()} {action}")
 
     def _create_command_terminal_section(self, parent):
         """Create command terminal section"""
@@ -344,15 +517,10 @@ Cmd>""",
         self.command_output.tag_config('info', foreground='#00ffff')
 
         # Welcome message
-        welcome_msg = "=" * 60 + "\n"
-        welcome_msg += "Advanced Command Terminal Ready\n"
         if self.is_demo_mode:
-            welcome_msg += "🎭 DEMO MODE - Simulated responses enabled\n"
+            welcome_msg = WELCOME_DEMO
         else:
-            welcome_msg += "🔌 Connected to device on port " + self.app.port + "\n"
-        welcome_msg += "Type 'help' for available commands\n"
-        welcome_msg += "=" * 60 + "\n\n"
-
+            welcome_msg = WELCOME_LIVE_TEMPLATE.format(port=self.app.port)
         self.command_output.insert('end', welcome_msg, 'info')
 
         # Command input area
@@ -388,75 +556,56 @@ Cmd>""",
                                    style='Content.TFrame')
         ref_frame.pack(fill='x')
 
-        ref_container = ttk.Frame(ref_frame, style='Content.TFrame')
-        ref_container.pack(padx=10, pady=10)
+        # Fill it in once it is scrolled into view. <Map> fires as soon as the
+        # frame is packed inside the scrolling canvas, so position is checked instead
+        ref_frame.after_idle(self._populate_reference_when_visible, ref_frame)
 
-        # Create columns
-        col1 = ttk.Frame(ref_container, style='Content.TFrame')
-        col1.pack(side='left', padx=(0, 20))
+    def _populate_reference_when_visible(self, ref_frame):
+        """Populate the command reference once part of it is on screen, else check again later"""
+        if not ref_frame.winfo_exists():
+            return
+        if self._is_scrolled_into_view(ref_frame):
+            self._populate_command_reference(ref_frame)
+        else:
+            ref_frame.after(REFERENCE_VIEW_POLL_MS, self._populate_reference_when_visible, ref_frame)
 
-        col2 = ttk.Frame(ref_container, style='Content.TFrame')
-        col2.pack(side='left', padx=(0, 20))
+    @staticmethod
+    def _is_scrolled_into_view(widget) -> bool:
+        """Return True if widget overlaps the visible area of its scrolling canvas"""
+        if not widget.winfo_viewable():
+            return False
 
-        col3 = ttk.Frame(ref_container, style='Content.TFrame')
-        col3.pack(side='left')
+        # Nearest enclosing canvas, or the toplevel when not scrolled
+        viewport = widget.nametowidget(widget.winfo_parent())
+        while viewport.winfo_class() != 'Canvas' and viewport is not viewport.winfo_toplevel():
+            viewport = viewport.nametowidget(viewport.winfo_parent())
 
-        # Column 1: Clock commands
-        ttk.Label(col1, text="Clock Commands:", style='Info.TLabel',
-                  font=('Arial', 10, 'bold')).pack(anchor='w', pady=(0, 5))
+        top = widget.winfo_rooty()
+        view_top = viewport.winfo_rooty()
+        return top < view_top + viewport.winfo_height() and top + widget.winfo_height() > view_top
 
-        clock_cmds = [
-            "clock          - Show clock status",
-            "clock l d      - Disable left MCIO clock",
-            "clock l e      - Enable left MCIO clock",
-            "clock r d      - Disable right MCIO clock",
-            "clock r e      - Enable right MCIO clock",
-            "clock srise5   - Set 0.5% spread",
-            "clock srise2   - Set 0.25% spread",
-            "clock srisd    - Disable spread"
-        ]
-
-        for cmd in clock_cmds:
-            ttk.Label(col1, text=cmd, style='Info.TLabel',
-                      font=('Consolas', 9)).pack(anchor='w')
-
-        # Column 2: Fmode commands
-        ttk.Label(col2, text="Flit Mode Commands:", style='Info.TLabel',
-                  font=('Arial', 10, 'bold')).pack(anchor='w', pady=(0, 5))
+    def _populate_command_reference(self, ref_frame):
+        """Create the command reference columns"""
+        ref_container = ttk.Frame(ref_frame, style='Content.TFrame')
+        ref_container.pack(padx=10, pady=10)
+
+        # One column per command group
+        last = len(COMMAND_REFERENCE) - 1
+        for index, (title, lines) in enumerate(COMMAND_REFERENCE):
+            self._create_reference_column(ref_container, title, lines,
+                                          padx=0 if index == last else (0, 20))
+
+    def _create_reference_column(self, parent, title: str, lines, padx):
+        """Create a single titled column of the command reference"""
+        column = ttk.Frame(parent, style='Content.TFrame')
+        column.pack(side='left', padx=padx)
 
-        fmode_cmds = [
-            "fmode              - Show flit mode status",
-            "fmode [port] en    - Enable flit mode",
-            "fmode [port] dis   - Disable flit mode",
-            "",
-            "Available ports:",
-            "  32, 80, 112, 128",
-            "",
-            "Example: fmode 32 en"
-        ]
-
-        for cmd in fmode_cmds:
-            ttk.Label(col2, text=cmd, style='Info.TLabel',
-                      font=('Consolas', 9)).pack(anchor='w')
-
-        # Column 3: General commands
-        ttk.Label(col3, text="General Commands:", style='Info.TLabel',
+        ttk.Label(column, text=title, style='Info.TLabel',
                   font=('Arial', 10, 'bold')).pack(anchor='w', pady=(0, 5))
 
-        general_cmds = [
-            "help       - Show all commands",
-            "ver        - Version information",
-            "sysinfo    - System information",
-            "lsd        - System diagnostics",
-            "showport   - Port status",
-            "showmode   - Current mode",
-            "setmode N  - Set mode (0-7)",
-            "reset      - System reset"
-        ]
-
-        for cmd in general_cmds:
-            ttk.Label(col3, text=cmd, style='Info.TLabel',
-                      font=('Consolas', 9)).pack(anchor='w')
+        # One multi-line label per column rather than one label per line
+        ttk.Label(column, text="\n".join(lines), style='Info.TLabel',
+                  font=('Consolas', 9), justify='left').pack(anchor='w')
 
     def _execute_command(self, command: str):
         """Execute a command and display the response"""
@@ -464,37 +613,27 @@ Cmd>""",
             return
 
         # Add to history
-        if command not in self.command_history:
+        if command not in self._history_set:
+            if len(self.command_history) == self.max_history:
+                self._history_set.discard(self.command_history[0])
             self.command_history.append(command)
-            if len(self.command_history) > self.max_history:
-                self.command_history.pop(0)
+            self._history_set.add(command)
         self.history_index = len(self.command_history)
 
-        # Display command in terminal
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        self.command_output.insert('end', f"[{timestamp}] Cmd> {command}\n", 'command')
+        # Command line to display - the run path writes it with any responses
+        timestamp = now_hms()
+        header = (f"[{timestamp}] Cmd> {command}\n", 'command')
 
-        # Get response
+        # Get response - several commands may be chained with ';'
+        parts = [part.strip() for part in command.split(';') if part.strip()]
         try:
-            if self.is_demo_mode:
-                response = self._get_demo_response(command)
-            else:
-                response = self._send_real_command(command)
-
-            # Display response
-            if response:
-                self.command_output.insert('end', response + "\n", 'response')
-            else:
-                self.command_output.insert('end', "No response received\n", 'error')
+            self._run_commands(header, parts)
 
         except Exception as e:
             error_msg = f"Error executing command: {str(e)}\n"
-            self.command_output.insert('end', error_msg, 'error')
+            self._write_output(error_msg, 'error')
             print(f"ERROR: {error_msg}")
 
-        # Auto-scroll to bottom
-        self.command_output.see('end')
-
         # Update command count
         self.command_count += 1
 
@@ -504,67 +643,320 @@ Cmd>""",
 
     def _get_demo_response(self, command: str) -> str:
         """Get demo response for a command"""
-        cmd_lower = command.lower().strip()
-
-        # Check for exact match first
-        if cmd_lower in self.demo_responses:
-            return self.demo_responses[cmd_lower]
-
-        # Check for partial matches
-        for demo_cmd, response in self.demo_responses.items():
-            if demo_cmd in cmd_lower or cmd_lower in demo_cmd:
-                return response
+        response = _lookup_demo_response(command.lower().strip())
+        if response is not None:
+            return response
 
         # Default response for unknown commands
         return f"Cmd>{command}\nCommand executed (Demo Mode)\nCmd>"
 
-    def _send_real_command(self, command: str) -> str:
-        """Send real command to device"""
-        if hasattr(self.app, 'cli') and self.app.cli:
-            try:
-                response = self.app.cli.send_command(command)
-                return response if response else "No response from device"
-            except Exception as e:
-                return f"Communication error: {str(e)}"
-        else:
+    def _run_demo_commands(self, header: tuple, commands: List[str]):
+        """Show the command line and every demo response"""
+        segments = list(header)
+        for command in commands:
+            segments.extend(self._response_segment(self._get_demo_response(command)))
+        self._write_output(*segments)
+
+    def _run_real_commands(self, header: tuple, commands: List[str]):
+        """Send commands to the device; responses arrive later through the sender thread"""
+        self._write_output(*header)
+        for command in commands:
+            self.enqueue_command(command)
+        self.flush_commands(self._show_response)
+
+    @staticmethod
+    def _response_segment(response: Optional[str]) -> tuple:
+        """Return the (text, tag) pair used to display a command response"""
+        if response:
+            return response + "\n", 'response'
+        return "No response received\n", 'error'
+
+    def _show_response(self, response: Optional[str]):
+        """Display a command response in the terminal"""
+        if not self.command_output or not self.command_output.winfo_exists():
+            return
+
+        self._write_output(*self._response_segment(response))
+
+    def _write_output(self, *segments: str):
+        """Queue text/tag segments for the terminal and schedule one flush for the burst"""
+        self._pending_output.extend(segments)
+        self._pending_chars += sum(len(text) for text in segments[::2])
+
+        if self._pending_chars >= OUTPUT_FLUSH_CHARS:
+            # Keep the queue bounded - write now rather than wait out the window
+            if self._output_flush_id is not None:
+                self.app.root.after_cancel(self._output_flush_id)
+            self._flush_output()
+        elif self._output_flush_id is None:
+            self._output_flush_id = self.app.root.after(OUTPUT_FLUSH_MS, self._flush_output)
+
+    def _flush_output(self):
+        """Insert every queued segment at once, trim the scrollback and scroll to the end"""
+        self._output_flush_id = None
+        segments, self._pending_output = self._pending_output, []
+        self._pending_chars = 0
+        if not segments or not self.command_output or not self.command_output.winfo_exists():
+            return
+
+        self.command_output.insert('end', *self._merge_segments(segments))
+
+        # Only ask Tk for the line count once enough new lines could matter
+        self._lines_since_trim += sum(text.count('\n') for text in segments[::2])
+        if self._lines_since_trim >= TRIM_OUTPUT_LINES:
+            self._lines_since_trim = 0
+            self._trim_output()
+
+        self.command_output.see('end')
+
+    @staticmethod
+    def _merge_segments(segments: List[str]) -> List[str]:
+        """Join neighbouring text segments that share a tag, so Tk tags fewer ranges"""
+        # Join each same-tag run once - repeated += on one string is quadratic for long bursts
+        merged = []
+        for tag, run in itertools.groupby(zip(segments[::2], segments[1::2]), key=itemgetter(1)):
+            merged += (''.join([text for text, _ in run]), tag)
+        return merged
+
+    def _trim_output(self):
+        """Drop the oldest terminal lines so long sessions keep inserts cheap"""
+        line_count = int(self.command_output.index('end-1c').split('.')[0])
+        if line_count > MAX_OUTPUT_LINES:
+            # A flushed burst may overshoot by more than one trim step
+            excess = line_count - (MAX_OUTPUT_LINES - TRIM_OUTPUT_LINES)
+            self.command_output.delete('1.0', f'{excess + 1}.0')
+
+    def enqueue_command(self, command: str):
+        """Queue a command for the next flush_commands call"""
+        self._pending_commands.append(command)
+
+    def flush_commands(self, callback: Callable[[Optional[str]], None]):
+        """
+        Send every queued command in a single write
+
+        The device answers a batch as one burst, so callback receives the
+        combined response text, or None on timeout.
+        """
+        batch, self._pending_commands = self._pending_commands, []
+        if not batch:
+            return
+
+        self._start_sender()
+        self._send_queue.put((batch, callback))
+
+    def _start_sender(self):
+        """Start the sender thread if it is not already running"""
+        if not self._wake_checked:
+            self._wake_checked = True
+            self._install_wakeup_pipe()
+
+        if self._send_thread and self._send_thread.is_alive():
+            return
+        self._send_thread = threading.Thread(target=self._send_loop, daemon=True)
+        self._send_thread.start()
+
+    def _send_loop(self):
+        """Run queued exchanges one at a time and hand each reply to the Tk thread"""
+        # shutdown() swaps in a new queue, so keep reading the one this thread started on
+        send_queue = self._send_queue
+        while True:
+            item = send_queue.get()
+            if item is None:  # shutdown() sentinel
+                return
+            batch, callback = item
+            self._dispatch(callback, self._exchange(batch))
+
+    def shutdown(self):
+        """Stop the sender thread once the exchanges already queued have run and release the wakeup pipe"""
+        sender = self._send_thread
+        if sender and sender.is_alive():
+            self._send_queue.put(None)
+            self._send_queue = queue.Queue()
+            # Give the exchanges ahead of the sentinel time to finish before the pipe closes
+            sender.join(SENDER_JOIN_TIMEOUT)
+        self._send_thread = None
+        self._remove_wakeup_pipe()
+
+        # Wakeups written while this method held the Tk thread went to the closed pipe
+        self._drain_completions()
+
+    def _exchange(self, commands: List[str]) -> Optional[str]:
+        """Write a batch and return its reply, an error message, or None on timeout"""
+        cli = getattr(self.app, 'cli', None)
+        if not cli or not getattr(cli, 'is_running', False):
             return "No device connection available"
 
+        # Hold the response queue for the whole exchange and start it empty, so
+        # neither stale lines nor another dashboard's reply end up in this one
+        with getattr(cli, 'exchange_lock', None) or nullcontext():
+            drain_responses = getattr(cli, 'drain_responses', None)
+            if drain_responses:
+                drain_responses()
+
+            error = self._send_real_commands(cli, commands)
+            if error:
+                return error
+            return self._collect_response(cli)
+
+    def _send_real_commands(self, cli, commands: List[str]) -> Optional[str]:
+        """Send real commands to device, returning an error message on failure"""
+        if cli is not self._bound_cli:
+            self._bound_cli = cli
+            self._send_batch = getattr(cli, 'send_commands', None) or (
+                lambda batch: all(cli.send_command(command) for command in batch))
+
+        try:
+            if not self._send_batch(commands):
+                return "Failed to send command to device"
+            return None
+        except Exception as e:
+            return f"Communication error: {str(e)}"
+
+    @staticmethod
+    def _collect_response(cli) -> Optional[str]:
+        """Block for the first reply line, then collect until the device goes quiet"""
+        try:
+            lines = [cli.response_queue.get(timeout=RESPONSE_TIMEOUT)]
+        except queue.Empty:
+            return None
+
+        # The reader queues one line at a time
+        while True:
+            try:
+                lines.append(cli.response_queue.get(timeout=RESPONSE_IDLE_TIMEOUT))
+            except queue.Empty:
+                return '\n'.join(lines)
+
+    def _install_wakeup_pipe(self):
+        """Let the sender thread wake Tk through a pipe file handler where Tk supports it"""
+        try:
+            read_fd, write_fd = os.pipe()
+        except OSError as e:
+            print(f"DEBUG: Wakeup pipe unavailable, using after(): {e}")
+            return
+
+        try:
+            os.set_blocking(read_fd, False)
+            self.app.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_wake)
+        except (AttributeError, OSError, RuntimeError, tk.TclError) as e:
+            # Windows Tk has no createfilehandler
+            os.close(read_fd)
+            os.close(write_fd)
+            print(f"DEBUG: Wakeup pipe unavailable, using after(): {e}")
+            return
+
+        with self._wake_lock:
+            self._wake_r, self._wake_w = read_fd, write_fd
+
+    def _remove_wakeup_pipe(self):
+        """Unregister the pipe file handler and close both ends"""
+        self._wake_checked = False
+        with self._wake_lock:
+            read_fd, write_fd = self._wake_r, self._wake_w
+            self._wake_r = self._wake_w = None
+            if read_fd is None:
+                return
+
+            try:
+                self.app.root.tk.deletefilehandler(read_fd)
+            except (AttributeError, RuntimeError, tk.TclError) as e:
+                print(f"DEBUG: Could not remove wakeup pipe handler: {e}")
+            # Closed under the lock so a late _dispatch never writes to a reused fd
+            for fd in (read_fd, write_fd):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _on_wake(self, fd, mask):
+        """Tk file handler: clear the pipe and run queued completions"""
+        try:
+            os.read(fd, 4096)
+        except BlockingIOError:
+            pass
+        self._drain_completions()
+
+    def _dispatch(self, callback, response: Optional[str]):
+        """Queue a completion and wake the Tk main loop once per burst"""
+        self._completions.append((callback, response))
+        if self._drain_scheduled.is_set():
+            return
+        self._drain_scheduled.set()
+        try:
+            with self._wake_lock:
+                wake_w = self._wake_w
+                if wake_w is not None:
+                    os.write(wake_w, b'\x01')
+            if wake_w is None:
+                self.app.root.after(0, self._drain_completions)
+        except (OSError, RuntimeError, tk.TclError) as e:
+            # Nothing will drain now; let the next completion try to wake Tk again
+            self._drain_scheduled.clear()
+            print(f"WARNING: Could not deliver command response: {e}")
+
+    def _drain_completions(self):
+        """Run every queued completion on the Tk thread"""
+        self._drain_scheduled.clear()
+        while self._completions:
+            callback, response = self._completions.popleft()
+            callback(response)
+
     def _on_command_enter(self):
         """Handle command entry"""
+        if self._nav_pending is not None:
+            # Apply a recalled entry that has not been written yet
+            self.command_entry.after_cancel(self._nav_pending)
+            self._apply_history_entry()
+
         command = self.command_entry.get().strip()
         if command:
             self._execute_command(command)
 
     def _navigate_history(self, direction: int):
-        """Navigate command history"""
-        if not self.command_history:
+        """Navigate command history, recalling only entries that start with the typed text"""
+        history = self.command_history
+        if not history:
             return
 
-        if direction < 0:  # Up arrow
-            if self.history_index > 0:
-                self.history_index -= 1
-        else:  # Down arrow
-            if self.history_index < len(self.command_history) - 1:
-                self.history_index += 1
-            else:
-                # At the end of history, clear entry
-                self.command_entry.delete(0, tk.END)
-                self.history_index = len(self.command_history)
-                return
+        if self.history_index >= len(history) and self._nav_pending is None:
+            # Starting a new recall - whatever is typed so far is the prefix to match
+            self._history_prefix = self.command_entry.get()
+        prefix = self._history_prefix
 
-        # Set entry to history command
-        if 0 <= self.history_index < len(self.command_history):
-            self.command_entry.delete(0, tk.END)
-            self.command_entry.insert(0, self.command_history[self.history_index])
+        index = self.history_index + direction
+        while 0 <= index < len(history) and not history[index].startswith(prefix):
+            index += direction
+
+        if index < 0:
+            return  # No older match - keep the current entry
+
+        if index >= len(history):
+            # Past the newest entry, restore what was typed
+            self.history_index = len(history)
+            text = prefix
+        else:
+            self.history_index = index
+            text = history[index]
+
+        # Held arrow keys repeat quickly - only the last recall needs writing
+        self._history_text = text
+        if self._nav_pending is None:
+            self._nav_pending = self.command_entry.after_idle(self._apply_history_entry)
+
+    def _apply_history_entry(self):
+        """Write the recalled history entry into the command entry"""
+        self._nav_pending = None
+        self.command_entry.delete(0, tk.END)
+        self.command_entry.insert(0, self._history_text)
 
     def _clear_terminal(self):
         """Clear the terminal output"""
+        self._pending_output = []
+        self._pending_chars = 0
         self.command_output.delete('1.0', tk.END)
 
         # Re-add welcome message
-        welcome_msg = "Terminal cleared\n"
-        welcome_msg += "Type 'help' for available commands\n\n"
-        self.command_output.insert('end', welcome_msg, 'info')
+        self.command_output.insert('end', CLEARED_MESSAGE, 'info')
 
     def _create_error_display(self, parent, error_msg: str):
         """Create error display when dashboard fails to load"""
@@ -18,16 +18,20 @@ import random
 import time
 import threading
 import queue
+from dataclasses import dataclass
 from datetime import datetime
 import os
 import re
+import zlib
+from functools import cached_property, lru_cache
+from pathlib import Path
 from typing import Dict, Any, Optional
 
 # Import Admin components for integration
 try:
     from Admin.cache_manager import DeviceDataCache
     from Admin.enhanced_sysinfo_parser import EnhancedSystemInfoParser
-    from Admin.debug_config import debug_print, debug_error, debug_info, debug_warning
+    from Admin.debug_config import debug_print, debug_error, debug_info, debug_warning, is_debug_enabled
     from Admin.settings_manager import SettingsManager
 
     ADMIN_COMPONENTS_AVAILABLE = True
@@ -35,6 +39,316 @@ except ImportError as e:
     print(f"Warning: Admin components not available: {e}")
     ADMIN_COMPONENTS_AVAILABLE = False
 
+# Component availability bits reported by the demo status/version responses
+PARSER_AVAILABLE = 1 << 0
+CACHE_AVAILABLE = 1 << 1
+SETTINGS_AVAILABLE = 1 << 2
+
+# Simulated response delay (seconds) keyed by command verb
+COMMAND_DELAYS = {
+    'sysinfo': 0.3,  # Longer delay for comprehensive command
+    'lsd': 0.2,  # Medium delay for diagnostic commands
+    'showport': 0.2,
+    'help': 0.05,  # Quick response for simple commands
+    'status': 0.05,
+    'version': 0.05,
+    'ver': 0.05,
+}
+DEFAULT_COMMAND_DELAY = 0.1
+
+# Demo reply keyed by reset verb, all answered by _handle_reset_command
+RESET_RESPONSES = {
+    'msrst': "Cmd>msrst\n\nResetting x16 Straddle Mount component...\nReset complete.\n\nOK>",
+    'swreset': "Cmd>swreset\n\nResetting Atlas 3 Switch component...\nReset complete.\n\nOK>",
+    'reset': "Cmd>reset\n\nPerforming full system reset...\nSystem reset complete.\nConnection terminated.",
+}
+
+# Idle wait for the background thread; disconnect() wakes it early with a None sentinel
+BACKGROUND_POLL_TIMEOUT = 0.5
+
+# The sysinfo dump alternates "=====" rule lines with section headers and bodies
+SECTION_SEPARATOR_RE = re.compile(r'^={40,}[ \t]*$', re.MULTILINE)
+
+# Parsed demo sysinfo is cached under a key derived from the content (stable across runs,
+# since the cache persists to disk) and re-parsed only once it goes stale
+SYSINFO_CACHE_KEY_PREFIX = "demo_sysinfo_"
+SYSINFO_FRESH_SECONDS = 300
+
+# Section markers that must all appear in a usable sysinfo dump
+REQUIRED_SECTIONS = ('ver', 'lsd', 'showport')
+REQUIRED_SECTIONS_RE = re.compile('|'.join(REQUIRED_SECTIONS), re.IGNORECASE)
+
+# Candidate demo data locations, searched in order; relative entries resolve against the cwd
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+SYSINFO_PATHS = (
+    "DemoData/sysinfo.txt",
+    "./DemoData/sysinfo.txt",
+    "../DemoData/sysinfo.txt",
+    os.path.join(MODULE_DIR, "DemoData", "sysinfo.txt"),
+    os.path.join(MODULE_DIR, "..", "DemoData", "sysinfo.txt"),
+    "sysinfo.txt",  # Current directory fallback
+)
+SHOWPORT_PATHS = (
+    "DemoData/showport.txt",
+    "./DemoData/showport.txt",
+    "../DemoData/showport.txt",
+    os.path.join(MODULE_DIR, "DemoData", "showport.txt"),
+    os.path.join(MODULE_DIR, "..", "DemoData", "showport.txt"),
+)
+
+# Fallback sysinfo dump used when DemoData/sysinfo.txt is missing, filled with str.format_map
+FALLBACK_SYSINFO_TEMPLATE = """================================================================================
+ver
+================================================================================
+
+S/N      : {serial_number}
+Company  : {company}
+Model    : {model}
+Version  : {version}    Date : {date}
+SBR Version : {sbr_version}
+
+================================================================================
+lsd
+================================================================================
+
+Thermal:
+        Board Temperature : {temperature} degree
+
+Fans Speed:
+        Switch Fan : {fan_rpm} rpm
+
+Voltage Sensors:
+Board    0.8V  Voltage : {mv_0v8} mV
+Board   0.89V  Voltage : {mv_0v89} mV
+Board    1.2V  Voltage : {mv_1v2} mV
+Board    1.5v  Voltage : {mv_1v5} mV
+
+Current Status:
+Current : {current_ma} mA
+
+Error Status:
+Voltage    0.8V  error : 0
+Voltage   0.89V  error : 0
+Voltage    1.2V  error : 0
+Voltage    1.5v  error : 0
+
+================================================================================
+showport
+================================================================================
+Port Slot------------------------------------------------------------------------------
+
+Port80 : speed 06, width 04, max_speed06, max_width16
+Port112: speed 01, width 00, max_speed06, max_width16
+Port128: speed 01, width 00, max_speed06, max_width16
+Port Upstream------------------------------------------------------------------------------
+
+Golden finger: speed 05, width 16, max_width = 16"""
+
+# Sensor noise ranges for the fallback dump, drawn once per process
+FALLBACK_SENSOR_RANGES = {
+    'fan_rpm': (5000, 7000),
+    'mv_0v8': (840, 860),
+    'mv_0v89': (910, 930),
+    'mv_1v2': (1240, 1260),
+    'mv_1v5': (1470, 1490),
+    'current_ma': (9000, 10000),
+}
+
+# Fallback lsd response, re-randomized on every call
+LSD_SENSOR_RANGES = {
+    'temperature_offset': (-2, 2),
+    'fan_rpm': (5500, 6500),
+    'mv_0v8': (840, 860),
+    'mv_0v89': (910, 930),
+    'mv_1v2': (1240, 1260),
+    'mv_1v5': (1470, 1490),
+    'current_ma': (9500, 10500),
+}
+
+FALLBACK_LSD_TEMPLATE = """Cmd>lsd
+
+Thermal:
+        Board Temperature : {temperature} degree
+
+Fans Speed:
+        Switch Fan : {fan_rpm} rpm
+
+Voltage Sensors:
+Board    0.8V  Voltage : {mv_0v8} mV
+Board   0.89V  Voltage : {mv_0v89} mV
+Board    1.2V  Voltage : {mv_1v2} mV
+Board    1.5v  Voltage : {mv_1v5} mV
+
+Current Status:
+Current : {current_ma} mA
+
+Error Status:
+Voltage    0.8V  error : 0
+Voltage   0.89V  error : 0
+Voltage    1.2V  error : 0
+Voltage    1.5v  error : 0
+
+OK>"""
+
+# Fallback showport output used when DemoData/showport.txt is missing
+FALLBACK_SHOWPORT = """Port Slot------------------------------------------------------------------------------
+
+Port80 : speed 06, width 04, max_speed06, max_width16
+Port112: speed 01, width 00, max_speed06, max_width16
+Port128: speed 05, width 16, max_speed06, max_width16
+
+Port Upstream------------------------------------------------------------------------------
+
+Golden finger: speed 06, width 16, max_width = 16"""
+
+# showport command reply built around the fallback output
+FALLBACK_SHOWPORT_RESPONSE = f"""Cmd>showport
+
+{FALLBACK_SHOWPORT}
+
+OK>"""
+
+# Fallback ver reply, filled with str.format_map from the demo device state
+FALLBACK_VER_TEMPLATE = """Cmd>ver
+
+S/N      : {serial_number}
+Company  : {company}
+Model    : {model}
+Version  : {version}    Date : {build_date}
+SBR Version : {sbr_version}
+
+OK>"""
+
+AVAILABLE = "Available"
+NOT_AVAILABLE = "Not Available"
+
+# Static demo help response
+HELP_TEXT = """Available commands:
+    help      - Show this help
+    sysinfo   - Get complete system information (ver + lsd + showport)
+    ver       - Get device version information
+    lsd       - Get system diagnostics (temperature, voltages, etc.)
+    showport  - Get port status information
+    status    - Get device status
+    version   - Get firmware version
+
+    Reset Commands:
+    msrst     - Reset x16 Straddle Mount component
+    swreset   - Reset Atlas 3 Switch component  
+    reset     - Full system reset (will disconnect)
+
+    Demo Mode: All responses use simulated device behavior with Admin integration"""
+
+# Demo response templates, filled with str.format_map
+STATUS_TEMPLATE = """Device Status:
+    Mode: Demo Mode (Enhanced)
+    Serial: {serial_number}
+    Temperature: {temperature}°C
+    Connection: Active
+    Parser: {parser}
+    Cache: {cache}
+    Settings: {settings}"""
+
+VERSION_TEMPLATE = """Firmware Version: {version} (DEMO)
+Hardware Rev: Rev C
+Serial Number: {serial_number}
+Build Date: {build_date}
+Bootloader: v1.0.5
+
+Enhanced Demo Mode with Admin Integration
+Parser: {parser}
+Cache: {cache}"""
+
+
+def _read_first_demo_file(paths, label, verify=None):
+    """Return the content of the first readable (and verified) candidate, or None"""
+    verbose = is_debug_enabled()
+    for i, path in enumerate(paths):
+        if verbose:
+            debug_print(f"Checking {label} path {i + 1}: {os.path.abspath(path)}", "FILE_CHECK")
+
+        # Open directly so a missing candidate costs a single failed syscall
+        try:
+            content = Path(path).read_text(encoding='utf-8')
+        except FileNotFoundError:
+            if verbose:
+                debug_print(f"{label} path does not exist: {os.path.abspath(path)}", "FILE_NOT_FOUND")
+            continue
+        except Exception as e:
+            debug_error(f"Error loading {label} {path}: {e}", "FILE_READ_ERROR")
+            continue
+
+        debug_info(f"Loaded demo {label} from {path} ({len(content)} chars)", "FILE_LOADED")
+
+        if verify is None:
+            return content
+        if verify(content):
+            debug_info(f"{label} content verification passed", "CONTENT_VERIFIED")
+            return content
+        debug_warning(f"{label} content verification failed for {path}", "CONTENT_VERIFY_FAILED")
+
+    return None
+
+
+def _verify_sysinfo_content(content: str) -> bool:
+    """Verify sysinfo content has expected sections"""
+    # One case-insensitive pass over the content, stopping once every marker is seen
+    found = set()
+    for match in REQUIRED_SECTIONS_RE.finditer(content):
+        found.add(match.group().lower())
+        if len(found) == len(REQUIRED_SECTIONS):
+            return True
+
+    missing_sections = [section for section in REQUIRED_SECTIONS if section not in found]
+    debug_error(f"Missing required sections: {missing_sections}", "CONTENT_MISSING_SECTIONS")
+    return False
+
+
+@lru_cache(maxsize=1)
+def _find_demo_sysinfo():
+    """Search for sysinfo.txt once per process; cleared by force_refresh_data"""
+    debug_info("Searching for demo sysinfo file", "DEMO_FILE_SEARCH")
+    return _read_first_demo_file(SYSINFO_PATHS, "sysinfo", _verify_sysinfo_content)
+
+
+@lru_cache(maxsize=1)
+def _find_demo_showport():
+    """Search for showport.txt once per process; cleared by force_refresh_data"""
+    debug_info("Searching for demo showport.txt file", "SHOWPORT_SEARCH")
+    return _read_first_demo_file(SHOWPORT_PATHS, "showport")
+
+
+def _draw_sensor_values(ranges):
+    """Draw one value per inclusive (low, high) range from a single RNG call"""
+    bits = random.getrandbits(32 * len(ranges))
+    values = {}
+    for name, (low, high) in ranges.items():
+        values[name] = low + (bits & 0xFFFFFFFF) % (high - low + 1)
+        bits >>= 32
+    return values
+
+
+@lru_cache(maxsize=1)
+def _fallback_sensor_values():
+    """Draw the fallback dump's sensor noise once; the values are demo filler"""
+    return _draw_sensor_values(FALLBACK_SENSOR_RANGES)
+
+
+@dataclass(frozen=True)
+class DemoDeviceState:
+    """Immutable identity and sensor baseline of the simulated device"""
+    __slots__ = ('current_mode', 'temperature', 'serial_number', 'firmware_version', 'company',
+                 'model', 'version', 'build_date', 'sbr_version')
+    current_mode: int
+    temperature: float
+    serial_number: str
+    firmware_version: str
+    company: str
+    model: str
+    version: str
+    build_date: str
+    sbr_version: str
+
 
 class EnhancedUnifiedDemoSerialCLI:
     """
@@ -47,6 +361,8 @@ class EnhancedUnifiedDemoSerialCLI:
     - Settings-based demo behavior configuration
     """
 
+    section_separator_re = SECTION_SEPARATOR_RE
+
     def __init__(self, port="DEMO", cache_manager=None, settings_manager=None):
         """
         Initialize Enhanced Demo CLI
@@ -60,8 +376,10 @@ class EnhancedUnifiedDemoSerialCLI:
         self.baudrate = 115200
         self.serial_connection = None
         self.is_running = False
-        self.command_queue = queue.Queue()
-        self.response_queue = queue.Queue()
+        # Plain put/get hand-offs between the caller and run_background; SimpleQueue is the
+        # C-implemented queue without Queue's task accounting and condition variables
+        self.command_queue = queue.SimpleQueue()
+        self.response_queue = queue.SimpleQueue()
         self.log_queue = queue.Queue()
 
         # Admin components integration
@@ -78,23 +396,62 @@ class EnhancedUnifiedDemoSerialCLI:
             debug_info("Enhanced parser initialized without cache manager", "DEMO_PARSER_INIT")
 
         # Demo device state with enhanced properties
-        self.demo_device_state = {
-            'current_mode': 0,  # Default SBR mode
-            'temperature': 45.5,
-            'serial_number': 'DEMO12345678',
-            'firmware_version': 'RC28',
-            'company': 'SerialCables,Inc',
-            'model': 'DEMO-PCI6-RD-x16HT-BG6-144',
-            'version': '1.0.0',
-            'build_date': 'Aug 19 2025 12:00:00',
-            'sbr_version': '0 34 160 28'
+        self.demo_device_state = DemoDeviceState(
+            current_mode=0,  # Default SBR mode
+            temperature=45.5,
+            serial_number='DEMO12345678',
+            firmware_version='RC28',
+            company='SerialCables,Inc',
+            model='DEMO-PCI6-RD-x16HT-BG6-144',
+            version='1.0.0',
+            build_date='Aug 19 2025 12:00:00',
+            sbr_version='0 34 160 28',
+        )
+
+        # Admin components are fixed after construction, so pack them once
+        self._component_bits = ((PARSER_AVAILABLE if self.parser else 0) |
+                                (CACHE_AVAILABLE if self.cache_manager else 0) |
+                                (SETTINGS_AVAILABLE if self.settings_manager else 0))
+
+        # Command verb -> response handler, resolved once per instance
+        self._command_handlers = {
+            'sysinfo': self._handle_sysinfo_command,
+            'ver': self._handle_ver_command,
+            'lsd': self._handle_lsd_command,
+            'showport': self._handle_showport_command,
+            'help': self._get_help_response,
+            '?': self._get_help_response,
+            'status': self._get_status_response,
+            'version': self._get_version_response,
+        }
+
+        # get_debug_info scaffold: fields fixed after construction are filled in once
+        self._debug_info_template = {
+            'is_running': None,
+            'port': self.port,
+            'sysinfo_content_available': None,
+            'sysinfo_content_size': None,
+            'showport_content_available': None,
+            'showport_content_size': None,
+            'parser_available': self.parser is not None,
+            'cache_manager_available': self.cache_manager is not None,
+            'settings_manager_available': self.settings_manager is not None,
+            'admin_components_available': ADMIN_COMPONENTS_AVAILABLE,
+            'command_queue_size': None,
+            'response_queue_size': None,
         }
 
+        # Last rendered status/version responses as (state key, text)
+        self._status_cache = None
+        self._version_cache = None
+
         # Load demo content from files
         self.demo_sysinfo_content = self._load_demo_sysinfo_file()
         self.demo_showport_content = self._load_demo_showport_file()
 
+
         # Parse demo content on initialization if available
+        self._sysinfo_parsed = False
         self._parse_initial_demo_content()
 
         debug_info(f"Enhanced UnifiedDemoSerialCLI initialized for {port}", "DEMO_CLI_INIT")
@@ -134,176 +491,110 @@ class EnhancedUnifiedDemoSerialCLI:
 
             if parsed_data:
                 debug_info("Initial demo content parsed successfully", "DEMO_PARSE_SUCCESS")
+                self._sysinfo_parsed = True
 
                 # Cache the parsed data if cache manager available
                 if self.cache_manager:
-                    cache_key = "demo_sysinfo_initial"
-                    self.cache_manager.store(cache_key, parsed_data, "sysinfo")
-                    debug_info(f"Initial demo data cached with key: {cache_key}", "DEMO_CACHE_STORED")
+                    self._store_parsed_sysinfo(parsed_data)
             else:
                 debug_error("Initial demo content parsing failed", "DEMO_PARSE_FAILED")
 
         except Exception as e:
             debug_error(f"Initial demo content parsing exception: {e}", "DEMO_PARSE_EXCEPTION")
 
-    def _load_demo_sysinfo_file(self):
-        """Load sysinfo.txt from multiple possible locations with enhanced debugging"""
-        demo_paths = [
-            "DemoData/sysinfo.txt",
-            "./DemoData/sysinfo.txt",
-            "../DemoData/sysinfo.txt",
-            os.path.join(os.path.dirname(__file__), "DemoData", "sysinfo.txt"),
-            os.path.join(os.path.dirname(__file__), "..", "DemoData", "sysinfo.txt"),
-            os.path.join(os.getcwd(), "DemoData", "sysinfo.txt"),
-            "sysinfo.txt",  # Current directory fallback
-        ]
-
-        debug_info("Searching for demo sysinfo file", "DEMO_FILE_SEARCH")
-
-        for i, path in enumerate(demo_paths):
-            abs_path = os.path.abspath(path)
-            debug_print(f"Checking sysinfo path {i + 1}: {abs_path}", "FILE_CHECK")
-
-            if os.path.exists(path):
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    debug_info(f"Loaded demo sysinfo from {path} ({len(content)} chars)", "FILE_LOADED")
+    def _split_sysinfo_sections(self, content):
+        """Split the sysinfo dump on its rule lines into a {header: body} dict"""
+        if not content:
+            return {}
+        parts = self.section_separator_re.split(content)
+        return {header.strip().lower(): body.strip()
+                for header, body in zip(parts[1::2], parts[2::2])}
+
+    # Demo content is static once loaded, so the sections and their formatted
+    # responses are computed on first use and kept until force_refresh_data
+    @cached_property
+    def _sections(self):
+        """ver/lsd/showport bodies of the demo sysinfo dump"""
+        return self._split_sysinfo_sections(self.demo_sysinfo_content)
+
+    @cached_property
+    def _ver_response(self):
+        """Formatted ver response, or None if the dump has no ver section"""
+        ver_content = self._sections.get('ver')
+        return f"Cmd>ver\n\n{ver_content}\n\nOK>" if ver_content else None
+
+    @cached_property
+    def _lsd_response(self):
+        """Formatted lsd response, or None if the dump has no lsd section"""
+        lsd_content = self._sections.get('lsd')
+        return f"Cmd>lsd\n\n{lsd_content}\n\nOK>" if lsd_content else None
+
+    @cached_property
+    def _showport_response(self):
+        """Formatted showport response, preferring showport.txt over the sysinfo section"""
+        showport_content = self.demo_showport_content or self._sections.get('showport')
+        return f"Cmd>showport\n\n{showport_content}\n\nOK>" if showport_content else None
+
+    @cached_property
+    def _content_stats(self):
+        """Availability and size of the loaded demo content, as reported by get_debug_info"""
+        sysinfo, showport = self.demo_sysinfo_content, self.demo_showport_content
+        return {
+            'sysinfo_content_available': sysinfo is not None,
+            'sysinfo_content_size': len(sysinfo) if sysinfo else 0,
+            'showport_content_available': showport is not None,
+            'showport_content_size': len(showport) if showport else 0,
+        }
 
-                    # Verify content has expected sections
-                    if self._verify_sysinfo_content(content):
-                        debug_info("Sysinfo content verification passed", "CONTENT_VERIFIED")
-                        return content
-                    else:
-                        debug_warning(f"Sysinfo content verification failed for {path}", "CONTENT_VERIFY_FAILED")
-                        continue
+    def _invalidate_section_responses(self):
+        """Drop the cached sections and content key so they are rebuilt from freshly loaded content"""
+        for name in ('_sections', '_ver_response', '_lsd_response', '_showport_response',
+                     '_sysinfo_cache_key', '_content_stats'):
+            self.__dict__.pop(name, None)
 
-                except Exception as e:
-                    debug_error(f"Error loading sysinfo {path}: {e}", "FILE_READ_ERROR")
-                    continue
-            else:
-                debug_print(f"Sysinfo path does not exist: {abs_path}", "FILE_NOT_FOUND")
+    def _load_demo_sysinfo_file(self):
+        """Load sysinfo.txt from multiple possible locations with enhanced debugging"""
+        content = _find_demo_sysinfo()
+        if content is not None:
+            return content
 
         debug_warning("No sysinfo file found - creating fallback data", "SYSINFO_FALLBACK")
         return self._create_fallback_sysinfo()
 
     def _verify_sysinfo_content(self, content: str) -> bool:
         """Verify sysinfo content has expected sections"""
-        required_sections = ['ver', 'lsd', 'showport']
-        missing_sections = []
-
-        content_lower = content.lower()
-        for section in required_sections:
-            if section not in content_lower:
-                missing_sections.append(section)
-
-        if missing_sections:
-            debug_error(f"Missing required sections: {missing_sections}", "CONTENT_MISSING_SECTIONS")
-            return False
-
-        return True
+        return _verify_sysinfo_content(content)
 
     def _create_fallback_sysinfo(self):
         """Create fallback sysinfo data if file not found"""
-        current_time = datetime.now().strftime('%b %d %Y %H:%M:%S')
-
-        fallback_content = f"""================================================================================
-ver
-================================================================================
-
-S/N      : {self.demo_device_state['serial_number']}
-Company  : {self.demo_device_state['company']}
-Model    : {self.demo_device_state['model']}
-Version  : {self.demo_device_state['version']}    Date : {current_time}
-SBR Version : {self.demo_device_state['sbr_version']}
-
-================================================================================
-lsd
-================================================================================
-
-Thermal:
-        Board Temperature : {int(self.demo_device_state['temperature'])} degree
-
-Fans Speed:
-        Switch Fan : {random.randint(5000, 7000)} rpm
-
-Voltage Sensors:
-Board    0.8V  Voltage : {random.randint(840, 860)} mV
-Board   0.89V  Voltage : {random.randint(910, 930)} mV
-Board    1.2V  Voltage : {random.randint(1240, 1260)} mV
-Board    1.5v  Voltage : {random.randint(1470, 1490)} mV
-
-Current Status:
-Current : {random.randint(9000, 10000)} mA
-
-Error Status:
-Voltage    0.8V  error : 0
-Voltage   0.89V  error : 0
-Voltage    1.2V  error : 0
-Voltage    1.5v  error : 0
-
-================================================================================
-showport
-================================================================================
-Port Slot------------------------------------------------------------------------------
-
-Port80 : speed 06, width 04, max_speed06, max_width16
-Port112: speed 01, width 00, max_speed06, max_width16
-Port128: speed 01, width 00, max_speed06, max_width16
-Port Upstream------------------------------------------------------------------------------
-
-Golden finger: speed 05, width 16, max_width = 16"""
+        state = self.demo_device_state
+        fallback_content = FALLBACK_SYSINFO_TEMPLATE.format_map({
+            'serial_number': state.serial_number,
+            'company': state.company,
+            'model': state.model,
+            'version': state.version,
+            'date': datetime.now().strftime('%b %d %Y %H:%M:%S'),
+            'sbr_version': state.sbr_version,
+            'temperature': int(state.temperature),
+            **_fallback_sensor_values(),
+        })
 
         debug_info("Created fallback sysinfo data", "FALLBACK_CREATED")
         return fallback_content
 
     def _load_demo_showport_file(self):
         """Load showport.txt from DemoData directory"""
-        showport_paths = [
-            "DemoData/showport.txt",
-            "./DemoData/showport.txt",
-            "../DemoData/showport.txt",
-            os.path.join(os.path.dirname(__file__), "DemoData", "showport.txt"),
-            os.path.join(os.path.dirname(__file__), "..", "DemoData", "showport.txt"),
-            os.path.join(os.getcwd(), "DemoData", "showport.txt")
-        ]
-
-        debug_info("Searching for demo showport.txt file", "SHOWPORT_SEARCH")
-
-        for i, path in enumerate(showport_paths):
-            abs_path = os.path.abspath(path)
-            debug_print(f"Checking showport path {i + 1}: {abs_path}", "SHOWPORT_CHECK")
-
-            if os.path.exists(path):
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    debug_info(f"Loaded demo showport from {path} ({len(content)} chars)", "SHOWPORT_LOADED")
-                    return content
-                except Exception as e:
-                    debug_error(f"Error loading showport {path}: {e}", "SHOWPORT_READ_ERROR")
-                    continue
-            else:
-                debug_print(f"Showport path does not exist: {abs_path}", "SHOWPORT_NOT_FOUND")
+        content = _find_demo_showport()
+        if content is not None:
+            return content
 
         debug_warning("No showport.txt file found - creating fallback data", "SHOWPORT_FALLBACK")
         return self._create_fallback_showport()
 
     def _create_fallback_showport(self):
         """Create fallback showport data if file not found"""
-        fallback_content = """Port Slot------------------------------------------------------------------------------
-
-Port80 : speed 06, width 04, max_speed06, max_width16
-Port112: speed 01, width 00, max_speed06, max_width16
-Port128: speed 05, width 16, max_speed06, max_width16
-
-Port Upstream------------------------------------------------------------------------------
-
-Golden finger: speed 06, width 16, max_width = 16"""
-
-        debug_info("Created fallback showport data", "SHOWPORT_FALLBACK_CREATED")
-        return fallback_content
+        debug_info("Using fallback showport data", "SHOWPORT_FALLBACK_CREATED")
+        return FALLBACK_SHOWPORT
 
     def connect(self):
         """Simulate connection with enhanced debugging"""
@@ -340,6 +631,7 @@ Golden finger: speed 06, width 16, max_width = 16"""
         """Simulate disconnection with enhanced debugging"""
         debug_info("Disconnecting enhanced demo mode", "DEMO_DISCONNECT")
         self.is_running = False
+        self.command_queue.put(None)  # Wake the background thread so it exits now
         self.log_queue.put("DEMO: Enhanced unified demo connection closed")
         debug_info("Enhanced UnifiedDemoSerialCLI disconnected", "DEMO_DISCONNECT_SUCCESS")
 
@@ -358,25 +650,24 @@ Golden finger: speed 06, width 16, max_width = 16"""
             debug_error("Cannot send command - not running", "DEMO_SEND_NOT_RUNNING")
             return None
 
-        debug_info(f"Sending enhanced demo command: {command}", "DEMO_SEND_CMD")
+        if is_debug_enabled():
+            debug_info(f"Sending enhanced demo command: {command}", "DEMO_SEND_CMD")
 
         try:
             # Put command in queue for background processing
             self.command_queue.put(command)
             self.log_queue.put(f"DEMO SENT: {command}")
 
-            # Wait for response with timeout
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                try:
-                    response = self.response_queue.get_nowait()
-                    debug_info(f"Enhanced demo response received ({len(response)} chars)", "DEMO_RECV_SUCCESS")
-                    return response
-                except queue.Empty:
-                    time.sleep(0.1)  # Small delay before checking again
+            # Block until the background thread queues the response
+            try:
+                response = self.response_queue.get(timeout=timeout)
+            except queue.Empty:
+                debug_error(f"Enhanced demo command timeout after {timeout}s", "DEMO_TIMEOUT")
+                return None
 
-            debug_error(f"Enhanced demo command timeout after {timeout}s", "DEMO_TIMEOUT")
-            return None
+            if is_debug_enabled():
+                debug_info(f"Enhanced demo response received ({len(response)} chars)", "DEMO_RECV_SUCCESS")
+            return response
 
         except Exception as e:
             debug_error(f"Enhanced demo command failed: {e}", "DEMO_SEND_ERROR")
@@ -388,7 +679,8 @@ Golden finger: speed 06, width 16, max_width = 16"""
             try:
                 response = self.response_queue.get_nowait()
                 self.log_queue.put(f"DEMO RECV: {response[:100]}...")  # Limit log size
-                debug_info(f"Demo response read: {len(response)} chars", "DEMO_READ_SUCCESS")
+                if is_debug_enabled():
+                    debug_info(f"Demo response read: {len(response)} chars", "DEMO_READ_SUCCESS")
                 return response
             except queue.Empty:
                 debug_print("No response in queue", "DEMO_READ_EMPTY")
@@ -401,73 +693,84 @@ Golden finger: speed 06, width 16, max_width = 16"""
         debug_info("Enhanced UnifiedDemoSerialCLI background thread started", "DEMO_BG_START")
 
         while self.is_running:
+            # Block for the first command, then take everything else already queued in one pass
             try:
-                # Check for commands with timeout
+                commands = [self.command_queue.get(timeout=BACKGROUND_POLL_TIMEOUT)]
+            except queue.Empty:
+                continue
+            while True:
                 try:
-                    command = self.command_queue.get(timeout=0.1)
-                    debug_info(f"Background thread processing command: {command}", "DEMO_BG_PROCESS")
+                    commands.append(self.command_queue.get_nowait())
+                except queue.Empty:
+                    break
 
-                    # Process the command with enhanced handling
-                    response = self._handle_enhanced_command(command)
+            for command in commands:
+                if not self.is_running:
+                    break
+                if command is None:
+                    continue
+                try:
+                    self._process_background_command(command)
+                except Exception as e:
+                    debug_error(f"Background thread error: {e}", "DEMO_BG_ERROR")
+                    import traceback
+                    traceback.print_exc()
 
-                    if response:
-                        debug_info(f"Generated response ({len(response)} chars)", "DEMO_BG_RESPONSE")
+        debug_info("Enhanced background thread ending", "DEMO_BG_END")
 
-                        # Simulate realistic delay based on settings
-                        delay = self._get_command_delay(command)
-                        if delay > 0:
-                            debug_info(f"Simulating command delay: {delay}s", "DEMO_BG_DELAY")
-                            time.sleep(delay)
+    def _process_background_command(self, command):
+        """Answer one queued command and hand the response to send_command"""
+        verbose = is_debug_enabled()
+        if verbose:
+            debug_info(f"Background thread processing command: {command}", "DEMO_BG_PROCESS")
 
-                        # Put response in queue
-                        self.response_queue.put(response)
-                        debug_info("Response queued successfully", "DEMO_BG_QUEUED")
-                    else:
-                        debug_warning(f"No response generated for command: {command}", "DEMO_BG_NO_RESPONSE")
+        # Normalize once for both dispatch and the delay lookup
+        command_lower = command.lower().strip()
 
-                except queue.Empty:
-                    # No command to process, continue loop
-                    pass
+        # Process the command with enhanced handling
+        response = self._handle_enhanced_command(command, command_lower)
 
-            except Exception as e:
-                debug_error(f"Background thread error: {e}", "DEMO_BG_ERROR")
-                import traceback
-                traceback.print_exc()
+        if not response:
+            debug_warning(f"No response generated for command: {command}", "DEMO_BG_NO_RESPONSE")
+            return
 
-            # Small delay to prevent CPU spinning
-            time.sleep(0.05)
+        if verbose:
+            debug_info(f"Generated response ({len(response)} chars)", "DEMO_BG_RESPONSE")
 
-        debug_info("Enhanced background thread ending", "DEMO_BG_END")
+        # Simulate realistic delay based on settings
+        delay = self._get_command_delay(command_lower)
+        if delay > 0:
+            if verbose:
+                debug_info(f"Simulating command delay: {delay}s", "DEMO_BG_DELAY")
+            time.sleep(delay)
 
-    def _handle_enhanced_command(self, command):
+        # Put response in queue
+        self.response_queue.put(response)
+        debug_info("Response queued successfully", "DEMO_BG_QUEUED")
+
+    def _handle_enhanced_command(self, command, command_lower=None):
         """
         Enhanced command handling with Admin components integration
 
         Args:
             command: Command to process
+            command_lower: Pre-normalized (lowercased, stripped) command, if the caller has it
 
         Returns:
             Response string or None
         """
-        command_lower = command.lower().strip()
-        debug_info(f"Processing enhanced command: '{command}' -> '{command_lower}'", "DEMO_CMD_PROCESS")
-
-        if 'sysinfo' in command_lower:
-            return self._handle_sysinfo_command()
-        elif 'ver' in command_lower and 'sysinfo' not in command_lower:
-            return self._handle_ver_command()
-        elif 'lsd' in command_lower:
-            return self._handle_lsd_command()
-        elif 'showport' in command_lower:
-            return self._handle_showport_command()
-        elif command_lower in ['help', '?']:
-            return self._get_help_response()
-        elif 'status' in command_lower:
-            return self._get_status_response()
-        elif 'version' in command_lower:
-            return self._get_version_response()
-        elif any(reset_cmd in command_lower for reset_cmd in ['reset', 'msrst', 'swreset']):
-            return self._handle_reset_command(command_lower)
+        if command_lower is None:
+            command_lower = command.lower().strip()
+        if is_debug_enabled():
+            debug_info(f"Processing enhanced command: '{command}' -> '{command_lower}'", "DEMO_CMD_PROCESS")
+
+        tokens = command_lower.split(None, 1)
+        verb = tokens[0] if tokens else ''
+        handler = self._command_handlers.get(verb)
+        if handler:
+            return handler()
+        elif verb in RESET_RESPONSES:
+            return self._handle_reset_command(verb)
         else:
             debug_warning(f"Unknown command: {command}", "DEMO_CMD_UNKNOWN")
             return f"Unknown command: {command}\nType 'help' for available commands."
@@ -481,8 +784,11 @@ Golden finger: speed 06, width 16, max_width = 16"""
             return "Error: Demo sysinfo data not available"
 
         try:
-            # Parse the content using enhanced parser if available
-            if self.parser:
+            # Parse the content using enhanced parser if available; the content is static,
+            # so a parse that is still fresh in the cache is reused
+            if self.parser and self._sysinfo_parse_is_fresh():
+                debug_info("Parsed sysinfo still fresh - skipping re-parse", "DEMO_SYSINFO_FRESH")
+            elif self.parser:
                 debug_info("Using enhanced parser for sysinfo", "DEMO_SYSINFO_PARSE")
 
                 parsed_data = self.parser.parse_unified_sysinfo(
@@ -492,189 +798,146 @@ Golden finger: speed 06, width 16, max_width = 16"""
 
                 if parsed_data:
                     debug_info("Sysinfo parsing successful", "DEMO_SYSINFO_PARSE_SUCCESS")
+                    self._sysinfo_parsed = True
 
-                    # Cache the parsed data
+                    # Cache the parsed data under the content key
                     if self.cache_manager:
-                        cache_key = f"demo_sysinfo_{int(time.time())}"
-                        self.cache_manager.store(cache_key, parsed_data, "sysinfo")
-                        debug_info(f"Sysinfo data cached with key: {cache_key}", "DEMO_SYSINFO_CACHED")
+                        self._store_parsed_sysinfo(parsed_data)
                 else:
                     debug_warning("Sysinfo parsing returned no data", "DEMO_SYSINFO_PARSE_EMPTY")
 
             # Return the raw sysinfo content for command response
-            debug_info(f"Returning sysinfo content ({len(self.demo_sysinfo_content)} chars)", "DEMO_SYSINFO_RETURN")
+            if is_debug_enabled():
+                debug_info(f"Returning sysinfo content ({len(self.demo_sysinfo_content)} chars)", "DEMO_SYSINFO_RETURN")
             return self.demo_sysinfo_content
 
         except Exception as e:
             debug_error(f"Sysinfo command handling failed: {e}", "DEMO_SYSINFO_ERROR")
             return f"Error processing sysinfo command: {e}"
 
+    @cached_property
+    def _sysinfo_cache_key(self):
+        """Cache key for the parsed demo sysinfo, derived from its content"""
+        content = self.demo_sysinfo_content or ''
+        return f"{SYSINFO_CACHE_KEY_PREFIX}{zlib.crc32(content.encode('utf-8')):08x}"
+
+    def _store_parsed_sysinfo(self, parsed_data):
+        """Cache parsed sysinfo once per content key; an unexpired entry is left alone"""
+        cache_key = self._sysinfo_cache_key
+        if self.cache_manager.get(cache_key) is not None:
+            return
+        self.cache_manager.set(cache_key, parsed_data, "sysinfo")
+        debug_info(f"Demo sysinfo data cached with key: {cache_key}", "DEMO_SYSINFO_CACHED")
+
+    def _sysinfo_parse_is_fresh(self):
+        """True if the static demo sysinfo was parsed and (when cached) has not gone stale"""
+        if not self._sysinfo_parsed:
+            return False
+        return self.cache_manager is None or self.parser.is_data_fresh(SYSINFO_FRESH_SECONDS)
+
     def _handle_ver_command(self):
         """Handle ver command separately"""
         debug_info("Handling ver command", "DEMO_VER_HANDLE")
 
-        # Extract ver section from sysinfo content
-        if self.demo_sysinfo_content:
-            ver_match = re.search(r'ver\s*=+\s*(.*?)\s*=+', self.demo_sysinfo_content, re.DOTALL | re.IGNORECASE)
-            if ver_match:
-                ver_content = ver_match.group(1).strip()
-                debug_info("Ver section extracted successfully", "DEMO_VER_EXTRACTED")
-                return f"Cmd>ver\n\n{ver_content}\n\nOK>"
+        if self._ver_response:
+            debug_info("Using cached ver section", "DEMO_VER_EXTRACTED")
+            return self._ver_response
 
         # Fallback ver response
         debug_warning("Using fallback ver response", "DEMO_VER_FALLBACK")
-        return f"""Cmd>ver
-
-S/N      : {self.demo_device_state['serial_number']}
-Company  : {self.demo_device_state['company']}
-Model    : {self.demo_device_state['model']}
-Version  : {self.demo_device_state['version']}    Date : {self.demo_device_state['build_date']}
-SBR Version : {self.demo_device_state['sbr_version']}
-
-OK>"""
+        state = self.demo_device_state
+        return FALLBACK_VER_TEMPLATE.format_map({
+            'serial_number': state.serial_number,
+            'company': state.company,
+            'model': state.model,
+            'version': state.version,
+            'build_date': state.build_date,
+            'sbr_version': state.sbr_version,
+        })
 
     def _handle_lsd_command(self):
         """Handle lsd command separately"""
         debug_info("Handling lsd command", "DEMO_LSD_HANDLE")
 
-        # Extract lsd section from sysinfo content
-        if self.demo_sysinfo_content:
-            lsd_match = re.search(r'lsd\s*=+\s*(.*?)\s*=+', self.demo_sysinfo_content, re.DOTALL | re.IGNORECASE)
-            if lsd_match:
-                lsd_content = lsd_match.group(1).strip()
-                debug_info("LSD section extracted successfully", "DEMO_LSD_EXTRACTED")
-                return f"Cmd>lsd\n\n{lsd_content}\n\nOK>"
+        if self._lsd_response:
+            debug_info("Using cached LSD section", "DEMO_LSD_EXTRACTED")
+            return self._lsd_response
 
         # Fallback lsd response with random values
         debug_warning("Using fallback lsd response", "DEMO_LSD_FALLBACK")
-        temp = int(self.demo_device_state['temperature']) + random.randint(-2, 2)
-        return f"""Cmd>lsd
-
-Thermal:
-        Board Temperature : {temp} degree
-
-Fans Speed:
-        Switch Fan : {random.randint(5500, 6500)} rpm
-
-Voltage Sensors:
-Board    0.8V  Voltage : {random.randint(840, 860)} mV
-Board   0.89V  Voltage : {random.randint(910, 930)} mV
-Board    1.2V  Voltage : {random.randint(1240, 1260)} mV
-Board    1.5v  Voltage : {random.randint(1470, 1490)} mV
-
-Current Status:
-Current : {random.randint(9500, 10500)} mA
-
-Error Status:
-Voltage    0.8V  error : 0
-Voltage   0.89V  error : 0
-Voltage    1.2V  error : 0
-Voltage    1.5v  error : 0
-
-OK>"""
+        values = _draw_sensor_values(LSD_SENSOR_RANGES)
+        values['temperature'] = int(self.demo_device_state.temperature) + values.pop('temperature_offset')
+        return FALLBACK_LSD_TEMPLATE.format_map(values)
 
     def _handle_showport_command(self):
         """Handle showport command separately"""
         debug_info("Handling showport command", "DEMO_SHOWPORT_HANDLE")
 
-        if self.demo_showport_content:
-            debug_info("Using demo showport content", "DEMO_SHOWPORT_CONTENT")
-            return f"Cmd>showport\n\n{self.demo_showport_content}\n\nOK>"
-        elif self.demo_sysinfo_content:
-            # Extract showport section from sysinfo content
-            showport_match = re.search(r'showport\s*=+\s*(.*?)(?:\s*=+|$)', self.demo_sysinfo_content,
-                                       re.DOTALL | re.IGNORECASE)
-            if showport_match:
-                showport_content = showport_match.group(1).strip()
-                debug_info("Showport section extracted from sysinfo", "DEMO_SHOWPORT_EXTRACTED")
-                return f"Cmd>showport\n\n{showport_content}\n\nOK>"
+        if self._showport_response:
+            debug_info("Using cached showport section", "DEMO_SHOWPORT_CONTENT")
+            return self._showport_response
 
         # Fallback showport response
         debug_warning("Using fallback showport response", "DEMO_SHOWPORT_FALLBACK")
-        return f"""Cmd>showport
-
-Port Slot------------------------------------------------------------------------------
-
-Port80 : speed 06, width 04, max_speed06, max_width16
-Port112: speed 01, width 00, max_speed06, max_width16
-Port128: speed 01, width 00, max_speed06, max_width16
-Port Upstream------------------------------------------------------------------------------
-
-Golden finger: speed 05, width 16, max_width = 16
-
-OK>"""
+        return FALLBACK_SHOWPORT_RESPONSE
 
-    def _handle_reset_command(self, command_lower):
-        """Handle reset commands"""
-        debug_info(f"Handling reset command: {command_lower}", "DEMO_RESET_HANDLE")
+    def _handle_reset_command(self, verb):
+        """Handle a reset verb from RESET_RESPONSES"""
+        debug_info(f"Handling reset command: {verb}", "DEMO_RESET_HANDLE")
 
-        if 'msrst' in command_lower:
-            return "Cmd>msrst\n\nResetting x16 Straddle Mount component...\nReset complete.\n\nOK>"
-        elif 'swreset' in command_lower:
-            return "Cmd>swreset\n\nResetting Atlas 3 Switch component...\nReset complete.\n\nOK>"
-        elif 'reset' in command_lower:
+        if verb == 'reset':
             # Full system reset - will disconnect
             self.is_running = False
-            return "Cmd>reset\n\nPerforming full system reset...\nSystem reset complete.\nConnection terminated."
-        else:
-            return f"Unknown reset command: {command_lower}"
+        return RESET_RESPONSES[verb]
 
-    def _get_command_delay(self, command):
-        """Get realistic delay for command response based on settings"""
+    def _get_command_delay(self, command_lower):
+        """Get realistic delay for an already-lowercased command based on settings"""
         if not self.settings_manager or not self.settings_manager.get('demo', 'simulate_delays', True):
             return 0
 
-        command_lower = command.lower()
-
-        if 'sysinfo' in command_lower:
-            return 0.3  # Longer delay for comprehensive command
-        elif any(cmd in command_lower for cmd in ['lsd', 'showport']):
-            return 0.2  # Medium delay for diagnostic commands
-        elif any(cmd in command_lower for cmd in ['help', 'status', 'version', 'ver']):
-            return 0.05  # Quick response for simple commands
-        else:
-            return 0.1  # Default delay
+        tokens = command_lower.split(None, 1)
+        verb = tokens[0] if tokens else ''
+        return COMMAND_DELAYS.get(verb, DEFAULT_COMMAND_DELAY)
 
     def _get_help_response(self):
         """Generate help command response"""
-        return """Available commands:
-    help      - Show this help
-    sysinfo   - Get complete system information (ver + lsd + showport)
-    ver       - Get device version information
-    lsd       - Get system diagnostics (temperature, voltages, etc.)
-    showport  - Get port status information
-    status    - Get device status
-    version   - Get firmware version
-
-    Reset Commands:
-    msrst     - Reset x16 Straddle Mount component
-    swreset   - Reset Atlas 3 Switch component  
-    reset     - Full system reset (will disconnect)
-
-    Demo Mode: All responses use simulated device behavior with Admin integration"""
+        return HELP_TEXT
 
     def _get_status_response(self):
         """Generate status command response"""
-        return f"""Device Status:
-    Mode: Demo Mode (Enhanced)
-    Serial: {self.demo_device_state['serial_number']}
-    Temperature: {self.demo_device_state['temperature']}°C
-    Connection: Active
-    Parser: {'Available' if self.parser else 'Not Available'}
-    Cache: {'Available' if self.cache_manager else 'Not Available'}
-    Settings: {'Available' if self.settings_manager else 'Not Available'}"""
+        state = self.demo_device_state
+        bits = self._component_bits
+        key = (state, bits)
+        if self._status_cache and self._status_cache[0] == key:
+            return self._status_cache[1]
+
+        response = STATUS_TEMPLATE.format_map({
+            'serial_number': state.serial_number,
+            'temperature': state.temperature,
+            'parser': AVAILABLE if bits & PARSER_AVAILABLE else NOT_AVAILABLE,
+            'cache': AVAILABLE if bits & CACHE_AVAILABLE else NOT_AVAILABLE,
+            'settings': AVAILABLE if bits & SETTINGS_AVAILABLE else NOT_AVAILABLE,
+        })
+        self._status_cache = (key, response)
+        return response
 
     def _get_version_response(self):
         """Generate version command response"""
-        return f"""Firmware Version: {self.demo_device_state['version']} (DEMO)
-Hardware Rev: Rev C
-Serial Number: {self.demo_device_state['serial_number']}
-Build Date: {self.demo_device_state['build_date']}
-Bootloader: v1.0.5
-
-Enhanced Demo Mode with Admin Integration
-Parser: {'Available' if self.parser else 'Not Available'}
-Cache: {'Available' if self.cache_manager else 'Not Available'}"""
+        state = self.demo_device_state
+        bits = self._component_bits
+        key = (state, bits)
+        if self._version_cache and self._version_cache[0] == key:
+            return self._version_cache[1]
+
+        response = VERSION_TEMPLATE.format_map({
+            'version': state.version,
+            'serial_number': state.serial_number,
+            'build_date': state.build_date,
+            'parser': AVAILABLE if bits & PARSER_AVAILABLE else NOT_AVAILABLE,
+            'cache': AVAILABLE if bits & CACHE_AVAILABLE else NOT_AVAILABLE,
+        })
+        self._version_cache = (key, response)
+        return response
 
     def get_host_card_data(self):
         """
@@ -738,11 +1001,15 @@ Cache: {'Available' if self.cache_manager else 'Not Available'}"""
                 self.cache_manager.clear()
                 debug_info("Cache cleared for refresh", "DEMO_CACHE_CLEARED")
 
-            # Reload demo files
+            # Reload demo files, dropping the memoized search results
+            _find_demo_sysinfo.cache_clear()
+            _find_demo_showport.cache_clear()
             self.demo_sysinfo_content = self._load_demo_sysinfo_file()
             self.demo_showport_content = self._load_demo_showport_file()
+            self._invalidate_section_responses()
 
             # Re-parse content
+            self._sysinfo_parsed = False
             self._parse_initial_demo_content()
 
             debug_info("Demo data refresh completed", "DEMO_REFRESH_SUCCESS")
@@ -759,27 +1026,22 @@ Cache: {'Available' if self.cache_manager else 'Not Available'}"""
         Returns:
             Debug information dictionary
         """
-        debug_info_dict = {
-            'is_running': self.is_running,
-            'port': self.port,
-            'sysinfo_content_available': self.demo_sysinfo_content is not None,
-            'sysinfo_content_size': len(self.demo_sysinfo_content) if self.demo_sysinfo_content else 0,
-            'showport_content_available': self.demo_showport_content is not None,
-            'showport_content_size': len(self.demo_showport_content) if self.demo_showport_content else 0,
-            'parser_available': self.parser is not None,
-            'cache_manager_available': self.cache_manager is not None,
-            'settings_manager_available': self.settings_manager is not None,
-            'admin_components_available': ADMIN_COMPONENTS_AVAILABLE,
-            'command_queue_size': self.command_queue.qsize(),
-            'response_queue_size': self.response_queue.qsize()
-        }
+        # Copy the prebuilt scaffold (fixed fields, key order) and fill in the live fields
+        debug_info_dict = self._debug_info_template.copy()
+        debug_info_dict.update(
+            is_running=self.is_running,
+            **self._content_stats,
+            command_queue_size=self.command_queue.qsize(),
+            response_queue_size=self.response_queue.qsize(),
+        )
 
         if self.cache_manager:
             debug_info_dict['cache_stats'] = self.cache_manager.get_stats()
 
-        if self.parser and self.parser.get_complete_sysinfo():
-            complete_data = self.parser.get_complete_sysinfo()
-            debug_info_dict['parsed_sections'] = list(complete_data.keys()) if complete_data else []
+            # The parser reads through the cache manager, so it has nothing to report without one
+            complete_data = self.parser.get_complete_sysinfo() if self.parser else None
+            if complete_data:
+                debug_info_dict['parsed_sections'] = list(complete_data.keys())
 
         return debug_info_dict
 
@@ -294,6 +294,10 @@ class FirmwareUploadDialog:
             percent: Progress percentage (0-100)
             message: Status message
         """
+        # Dialog may already have been closed by the user
+        if not self.dialog.winfo_exists():
+            return
+
         self.progress_var.set(percent)
         self.status_label.config(text=message)
         self.percent_label.config(text=f"{percent:.0f}%")
@@ -642,6 +646,10 @@ class FirmwareDashboard:
 
     def _update_upload_button_state(self):
         """Update upload button enabled state"""
+        # Dashboard may have been torn down while an upload was running
+        if not self.upload_btn.winfo_exists():
+            return
+
         has_file = bool(self.selected_file_path.get().strip())
         has_type = bool(self.selected_firmware_type.get())
 
@@ -699,16 +707,21 @@ class FirmwareDashboard:
             file_name = os.path.basename(file_path)
 
             # Create progress dialog
-            def create_progress_dialog():
-                self.current_upload_dialog = FirmwareUploadDialog(
-                    self.app.root,
-                    f"Uploading {firmware_type} Firmware",
-                    on_cancel=self._cancel_upload
-                )
+            dialog_ready = threading.Event()
 
-            # Create dialog on main thread
+            def create_progress_dialog():
+                try:
+                    self.current_upload_dialog = FirmwareUploadDialog(
+                        self.app.root,
+                        f"Uploading {firmware_type} Firmware",
+                        on_cancel=self._cancel_upload
+                    )
+                finally:
+                    dialog_ready.set()
+
+            # Create dialog on main thread and continue as soon as it exists
             self.app.root.after(0, create_progress_dialog)
-            time.sleep(0.5)  # Give dialog time to appear
+            dialog_ready.wait(timeout=2.0)
 
             # Create XMODEM handler
             def progress_update(percent, message):
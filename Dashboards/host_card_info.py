@@ -1,12 +1,16 @@
 import re
 import time
+import queue
 import threading
 import tkinter as tk
+from contextlib import nullcontext
 from tkinter import ttk, messagebox
 from datetime import datetime
 from dataclasses import dataclass
 from typing import Dict, Optional, Any, List, Tuple
 
+from Dashboards.refresh_throttle import RefreshThrottleMixin
+
 @dataclass
 class HostCardInfo:
     """Data class to store parsed host card information from ver and lsd commands"""
@@ -268,23 +272,25 @@ class HostCardInfoManager:
     def _refresh_info(self) -> None:
         """Send both ver and lsd commands and parse responses"""
         try:
-            # Send ver command
-            ver_success = self.cli.send_command("ver")
-            if not ver_success:
-                self.cached_info = self._get_error_info("Failed to send ver command")
-                return
-            
-            # Wait for ver response
-            ver_response = self._wait_for_response("ver", timeout=5.0)
-            
-            # Send lsd command
-            lsd_success = self.cli.send_command("lsd")
-            if not lsd_success:
-                self.cached_info = self._get_error_info("Failed to send lsd command")
-                return
-            
-            # Wait for lsd response
-            lsd_response = self._wait_for_response("lsd", timeout=5.0)
+            # Keep other response_queue readers out until both replies are in
+            with getattr(self.cli, 'exchange_lock', None) or nullcontext():
+                # Send ver command
+                ver_success = self._send_fresh_command("ver")
+                if not ver_success:
+                    self.cached_info = self._get_error_info("Failed to send ver command")
+                    return
+                
+                # Wait for ver response
+                ver_response = self._wait_for_response("ver", timeout=5.0)
+                
+                # Send lsd command
+                lsd_success = self._send_fresh_command("lsd")
+                if not lsd_success:
+                    self.cached_info = self._get_error_info("Failed to send lsd command")
+                    return
+                
+                # Wait for lsd response
+                lsd_response = self._wait_for_response("lsd", timeout=5.0)
             
             if ver_response or lsd_response:
                 # Parse both responses
@@ -299,34 +305,60 @@ class HostCardInfoManager:
         except Exception as e:
             self.cached_info = self._get_error_info(f"Error getting host card info: {str(e)}")
     
+    def _send_fresh_command(self, command: str) -> bool:
+        """Drop stale queued responses, then send command"""
+        drain_responses = getattr(self.cli, 'drain_responses', None)
+        if drain_responses:
+            drain_responses()
+        return self.cli.send_command(command)
+    
     def _wait_for_response(self, command: str, timeout: float = 5.0) -> Optional[str]:
         """Wait for command response"""
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         response_parts = []
+        # Each line is lowered once on arrival for the completion checks
+        lowered_parts = []
         
-        while (time.time() - start_time) < timeout:
-            response = self.cli.read_response()
+        # With the background reader running, block on its queue instead of polling
+        reader = getattr(self.cli, 'background_thread', None)
+        response_queue = self.cli.response_queue if reader and reader.is_alive() else None
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            if response_queue is not None:
+                try:
+                    response = response_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            else:
+                response = self.cli.read_response()
+            
             if response:
                 response_parts.append(response)
-                if self._is_response_complete(command, response_parts):
+                lowered_parts.append(response.lower())
+                if self._is_response_complete(command, lowered_parts):
                     return '\n'.join(response_parts)
-            time.sleep(0.1)
+            elif response_queue is None:
+                time.sleep(0.1)
         
         return '\n'.join(response_parts) if response_parts else None
     
-    def _is_response_complete(self, command: str, response_parts: List[str]) -> bool:
-        """Check if command response appears complete"""
-        if not response_parts:
+    def _is_response_complete(self, command: str, lowered_parts: List[str]) -> bool:
+        """Check if command response appears complete, given its lines already lowercased"""
+        if not lowered_parts:
             return False
         
-        full_response = '\n'.join(response_parts).lower()
+        full_response = '\n'.join(lowered_parts)
         
         # Command-specific completion checks
         if command == "ver":
             if "sbr version" in full_response or "date :" in full_response:
                 return True
         elif command == "lsd":
-            if "error :" in full_response and len(response_parts) > 10:
+            if "error :" in full_response and len(lowered_parts) > 10:
                 return True
         
         # General completion indicators
@@ -335,8 +367,8 @@ class HostCardInfoManager:
             if indicator in full_response:
                 return True
         
-        if len(response_parts) > 5:
-            last_line = response_parts[-1].strip().lower()
+        if len(lowered_parts) > 5:
+            last_line = lowered_parts[-1].strip()
             if len(last_line) < 10 and ('>' in last_line or '#' in last_line):
                 return True
         
@@ -350,7 +382,7 @@ class HostCardInfoManager:
         return info
 
 
-class HostCardDashboardUI:
+class HostCardDashboardUI(RefreshThrottleMixin):
     """UI components for the Host Card Information dashboard"""
 
     def __init__(self, dashboard_app):
@@ -359,6 +391,10 @@ class HostCardDashboardUI:
         self.raw_output_expanded = False
         self.auto_refresh_var = tk.BooleanVar()
 
+        # Refresh throttling state
+        self._init_refresh_throttle()
+        self._refresh_thread = None
+
     def create_host_dashboard(self):
         """Create the complete host card information dashboard - DEMO MODE COMPATIBLE"""
         print("DEBUG: HostCardDashboardUI.create_host_dashboard called")
@@ -514,7 +550,7 @@ class HostCardDashboardUI:
             for field_name, value in data_items:
                 # Skip empty or "Unknown" values unless it's sample data
                 if value and value != "Unknown":
-                    self.create_data_row(content_frame, field_name, value)
+                    self.create_data_row(content_frame, field_name, value, items_displayed)
                     items_displayed += 1
 
             # If no valid items were displayed, show a message
@@ -528,21 +564,22 @@ class HostCardDashboardUI:
                                       style='Info.TLabel', font=('Arial', 10, 'italic'))
             no_data_label.pack(pady=10)
 
-    def create_data_row(self, parent, field_name, value):
-        """Create a data row with field name and value"""
-        row_frame = ttk.Frame(parent, style='Content.TFrame')
-        row_frame.pack(fill='x', pady=2)
+    def create_data_row(self, parent, field_name, value, row):
+        """Create a data row with field name and value in the parent's grid"""
+        if row == 0:
+            # Values are right-aligned against the section edge
+            parent.columnconfigure(1, weight=1)
 
         # Field name label
-        field_label = ttk.Label(row_frame, text=f"{field_name}:",
+        field_label = ttk.Label(parent, text=f"{field_name}:",
                                 style='Info.TLabel', font=('Arial', 10, 'bold'))
-        field_label.pack(side='left')
+        field_label.grid(row=row, column=0, sticky='w', pady=2)
 
         # Value label with color coding for certain values
         value_color = self._get_value_color(field_name, value)
-        value_label = ttk.Label(row_frame, text=str(value),
+        value_label = ttk.Label(parent, text=str(value),
                                 style='Info.TLabel', font=('Arial', 10))
-        value_label.pack(side='right')
+        value_label.grid(row=row, column=1, sticky='e', pady=2)
 
         # Apply color if needed (this may not work with all ttk themes)
         try:
@@ -621,6 +658,9 @@ class HostCardDashboardUI:
 
     def refresh_demo_info(self):
         """Refresh demo information"""
+        if self._refresh_throttled(self.refresh_demo_info):
+            return
+
         try:
             print("DEBUG: Refreshing demo host information")
             # Clear existing content and recreate
@@ -640,22 +680,40 @@ class HostCardDashboardUI:
 
     def refresh_host_info(self):
         """Refresh host card information for real device"""
+        if self._refresh_throttled(self.refresh_host_info):
+            return
+
+        # ver + lsd can take seconds, so query the device off the Tk thread
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(target=self._refresh_host_info_worker, daemon=True)
+        self._refresh_thread.start()
+
+    def _refresh_host_info_worker(self):
+        """Force a host card info refresh and report back on the Tk thread"""
+        error_msg = None
         try:
-            # Force refresh of host card info
             self.app.host_card_manager.get_host_card_info(force_refresh=True)
-
-            # Refresh the dashboard display
-            if self.app.current_dashboard == "host":
-                self.app.update_content_area()
-
-            # Log the refresh action
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            self.app.log_data.append(f"[{timestamp}] Host card info refreshed (ver + lsd)")
-
         except Exception as e:
             error_msg = f"Failed to refresh host info: {str(e)}"
+
+        self.app.root.after(0, self._on_host_info_refreshed, error_msg)
+
+    def _on_host_info_refreshed(self, error_msg: Optional[str]):
+        """Show refreshed host card info, or the refresh error"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        if error_msg:
             self.app.log_data.append(f"[{timestamp}] {error_msg}")
             messagebox.showerror("Refresh Error", error_msg)
+            return
+
+        # Refresh the dashboard display
+        if self.app.current_dashboard == "host":
+            self.app.update_content_area()
+
+        # Log the refresh action
+        self.app.log_data.append(f"[{timestamp}] Host card info refreshed (ver + lsd)")
+
 
 # Demo mode support functions
 def get_demo_ver_response(device_state):
@@ -26,12 +26,61 @@ from PIL import Image, ImageTk
 try:
     from Admin.enhanced_sysinfo_parser import EnhancedSystemInfoParser
     from Admin.cache_manager import DeviceDataCache
-    from Admin.debug_config import debug_print, debug_error, debug_warning, debug_info
+    from Admin.debug_config import debug_print, debug_error, debug_warning, debug_info, is_debug_enabled
+    debug_available = True
 except ImportError as e:
     print(f"WARNING: Could not import Admin modules: {e}")
     EnhancedSystemInfoParser = None
     DeviceDataCache = None
     debug_print = print
+    debug_available = False
+
+
+# Speed level -> (generation label, status color)
+SPEED_MAPPINGS = {
+    "06": ("Gen6", "#00ff00"),  # Green
+    "05": ("Gen5", "#ff9500"),  # Yellow/Orange
+    "04": ("Gen4", "#ff9500"),  # Yellow/Orange
+    "03": ("Gen3", "#ff9500"),  # Yellow/Orange
+    "02": ("Gen2", "#ff9500"),  # Yellow/Orange
+    "01": ("Gen1", "#ff4444"),  # Red
+}
+
+# Link widths reported by showport
+LINK_WIDTHS = frozenset(("02", "04", "08", "16"))
+
+# Demo file contents keyed by filename, shared by every dashboard instance
+_DEMO_FILE_CACHE: Dict[str, str] = {}
+
+
+def _load_demo_file(filename: str) -> Optional[str]:
+    """Load a DemoData file once per process and serve later calls from memory"""
+    if filename in _DEMO_FILE_CACHE:
+        return _DEMO_FILE_CACHE[filename]
+
+    demo_paths = [
+        os.path.join("DemoData", filename),
+        os.path.join(".", "DemoData", filename),
+        os.path.join("..", "DemoData", filename),
+        os.path.join(os.path.dirname(__file__), "DemoData", filename),
+        os.path.join(os.getcwd(), "DemoData", filename)
+    ]
+
+    for path in demo_paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            debug_warning(f"Error reading {path}: {e}", "LINK_UI")
+            continue
+
+        debug_info(f"Loaded {filename} from {path} ({len(content)} chars)", "LINK_UI")
+        _DEMO_FILE_CACHE[filename] = content
+        return content
+
+    return None
 
 
 @dataclass
@@ -70,17 +119,24 @@ class LinkStatusInfo:
 class LinkStatusParser:
     """Parser for showport command responses"""
 
-    def __init__(self):
-        # Patterns for showport command parsing
-        self.port_patterns = [
-            r'Port(\d+)\s*:\s*speed\s+(\w+),\s*width\s+(\w+),\s*max_speed(\w+),\s*max_width(\d+)',
-            r'Port(\d+)\s*:\s*speed\s+(\w+),\s*width\s+(\w+)'
-        ]
+    # Patterns for showport command parsing, compiled once at import
+    PORT_PATTERNS = (
+        re.compile(r'Port(\d+)\s*:\s*speed\s+(\w+),\s*width\s+(\w+),\s*max_speed(\w+),\s*max_width(\d+)',
+                   re.IGNORECASE | re.MULTILINE),
+        re.compile(r'Port(\d+)\s*:\s*speed\s+(\w+),\s*width\s+(\w+)',
+                   re.IGNORECASE | re.MULTILINE)
+    )
+
+    GOLDEN_FINGER_PATTERNS = (
+        re.compile(r'Golden\s+finger:\s*speed\s+(\w+),\s*width\s+(\w+),\s*max_width\s*=\s*(\d+)',
+                   re.IGNORECASE | re.MULTILINE),
+        re.compile(r'Golden\s+finger:\s*speed\s+(\w+),\s*width\s+(\w+)',
+                   re.IGNORECASE | re.MULTILINE)
+    )
 
-        self.golden_finger_patterns = [
-            r'Golden\s+finger:\s*speed\s+(\w+),\s*width\s+(\w+),\s*max_width\s*=\s*(\d+)',
-            r'Golden\s+finger:\s*speed\s+(\w+),\s*width\s+(\w+)'
-        ]
+    def __init__(self):
+        self.port_patterns = self.PORT_PATTERNS
+        self.golden_finger_patterns = self.GOLDEN_FINGER_PATTERNS
 
     def parse_showport_response(self, showport_response: str) -> LinkStatusInfo:
         """Parse showport command response"""
@@ -88,25 +144,26 @@ class LinkStatusParser:
         info.raw_showport_response = showport_response
         info.last_updated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        # Parse individual ports
-        showport_lower = showport_response.lower()
-
-        # Parse regular ports
+        # Parse regular ports - patterns run most specific first, so a port
+        # already captured must not be overwritten by the shorter fallback
         for pattern in self.port_patterns:
-            matches = re.finditer(pattern, showport_response, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
+            for match in pattern.finditer(showport_response):
+                port_key = f"port_{match.group(1)}"
+                if port_key in info.ports:
+                    continue
                 port_info = self._create_port_info(match.groups())
                 if port_info:
-                    info.ports[f"port_{port_info.port_number}"] = port_info
+                    info.ports[port_key] = port_info
 
         # Parse golden finger
         for pattern in self.golden_finger_patterns:
-            match = re.search(pattern, showport_response, re.IGNORECASE | re.MULTILINE)
+            match = pattern.search(showport_response)
             if match:
                 info.golden_finger = self._create_golden_finger_info(match.groups())
                 break
 
-        debug_info(f"Parsed {len(info.ports)} ports and golden finger", "LINK_PARSER")
+        if debug_available and is_debug_enabled():
+            debug_info("Parsed %d ports and golden finger" % len(info.ports), "LINK_PARSER")
         return info
 
     def _create_port_info(self, match_groups: Tuple) -> Optional[PortInfo]:
@@ -156,17 +213,8 @@ class LinkStatusParser:
             return
 
         # Process speed level to generation
-        speed_mappings = {
-            "06": ("Gen6", "#00ff00"),  # Green
-            "05": ("Gen5", "#ff9500"),  # Yellow/Orange
-            "04": ("Gen4", "#ff9500"),  # Yellow/Orange
-            "03": ("Gen3", "#ff9500"),  # Yellow/Orange
-            "02": ("Gen2", "#ff9500"),  # Yellow/Orange
-            "01": ("Gen1", "#ff4444"),  # Red
-        }
-
-        if port_info.speed_level in speed_mappings:
-            port_info.display_speed, port_info.status_color = speed_mappings[port_info.speed_level]
+        if port_info.speed_level in SPEED_MAPPINGS:
+            port_info.display_speed, port_info.status_color = SPEED_MAPPINGS[port_info.speed_level]
             port_info.active = True
         else:
             port_info.display_speed = f"Level {port_info.speed_level}"
@@ -174,7 +222,7 @@ class LinkStatusParser:
             port_info.active = False
 
         # Process width
-        if port_info.width in ["02", "04", "08", "16"]:
+        if port_info.width in LINK_WIDTHS:
             port_info.display_width = f"x{port_info.width}"
         else:
             port_info.display_width = f"x{port_info.width}" if port_info.width != "00" else ""
@@ -189,9 +237,10 @@ class LinkStatusParser:
 class LinkStatusManager:
     """Manager class for handling link status information requests"""
 
-    def __init__(self, cli_instance, cache_manager=None, sysinfo_parser=None):
-        """Initialize with CLI instance and optional cache/parser"""
+    def __init__(self, cli_instance, cache_manager=None, sysinfo_parser=None, root=None):
+        """Initialize with CLI instance, optional cache/parser and the Tk root for timeouts"""
         self.cli = cli_instance
+        self.root = root
         self.parser = LinkStatusParser()
         self.cached_info: Optional[LinkStatusInfo] = None
         self.last_refresh: Optional[datetime] = None
@@ -205,6 +254,7 @@ class LinkStatusManager:
         # Command state tracking
         self.showport_requested = False
         self.showport_timeout = 10  # seconds
+        self._showport_timeout_id = None
 
     def get_link_status_info(self, force_refresh: bool = False) -> LinkStatusInfo:
         """Get link status information using showport command"""
@@ -258,8 +308,10 @@ class LinkStatusManager:
                 self.cached_info = self._get_error_info("Failed to send showport command")
                 return
 
-            # Start timeout timer
-            threading.Timer(self.showport_timeout, self._handle_showport_timeout).start()
+            # Time the request out on the Tk loop rather than a timer thread
+            if self.root:
+                self._showport_timeout_id = self.root.after(
+                    int(self.showport_timeout * 1000), self._handle_showport_timeout)
 
         except Exception as e:
             debug_error(f"Error during showport refresh: {e}", "LINK_MANAGER")
@@ -273,7 +325,10 @@ class LinkStatusManager:
                 debug_warning("Unexpected showport response received", "LINK_MANAGER")
                 return False
 
-            debug_info(f"Processing showport response ({len(response)} chars)", "LINK_MANAGER")
+            if debug_available and is_debug_enabled():
+                debug_info("Processing showport response (%d chars)" % len(response), "LINK_MANAGER")
+
+            self._cancel_showport_timeout()
 
             # Parse the response
             self.cached_info = self.parser.parse_showport_response(response)
@@ -284,7 +339,9 @@ class LinkStatusManager:
             if self.sysinfo_parser:
                 self.sysinfo_parser.parse_showport_command(response)
 
-            debug_info(f"Successfully processed showport with {len(self.cached_info.ports)} ports", "LINK_MANAGER")
+            if debug_available and is_debug_enabled():
+                debug_info("Successfully processed showport with %d ports" % len(self.cached_info.ports),
+                           "LINK_MANAGER")
             return True
 
         except Exception as e:
@@ -293,8 +350,15 @@ class LinkStatusManager:
             self.cached_info = self._get_error_info(f"Parse error: {e}")
             return False
 
+    def _cancel_showport_timeout(self):
+        """Cancel the pending showport timeout, if any"""
+        if self._showport_timeout_id is not None:
+            self.root.after_cancel(self._showport_timeout_id)
+            self._showport_timeout_id = None
+
     def _handle_showport_timeout(self):
         """Handle showport command timeout"""
+        self._showport_timeout_id = None
         if self.showport_requested:
             debug_warning("Showport command timed out", "LINK_MANAGER")
             self.showport_requested = False
@@ -350,6 +414,10 @@ class LinkStatusDashboardUI:
         self.app = dashboard_app
         self.hc_image = None
 
+        # Last parsed demo showport content and its result
+        self._demo_content: Optional[str] = None
+        self._demo_link_info: Optional[LinkStatusInfo] = None
+
         # Initialize Link Status Manager with admin integrations
         cache_manager = getattr(self.app, 'cache_manager', None)
         sysinfo_parser = getattr(self.app, 'sysinfo_parser', None)
@@ -357,7 +425,8 @@ class LinkStatusDashboardUI:
         self.link_status_manager = LinkStatusManager(
             self.app.cli,
             cache_manager=cache_manager,
-            sysinfo_parser=sysinfo_parser
+            sysinfo_parser=sysinfo_parser,
+            root=self.app.root
         )
 
         # Set up log monitoring for showport responses
@@ -404,10 +473,15 @@ class LinkStatusDashboardUI:
             demo_content = self._load_demo_showport_file()
 
             if demo_content:
-                debug_info(f"Using demo showport content ({len(demo_content)} chars)", "LINK_UI")
-
-                # Parse and cache the showport data
-                link_info = self.link_status_manager.parser.parse_showport_response(demo_content)
+                if debug_available and is_debug_enabled():
+                    debug_info("Using demo showport content (%d chars)" % len(demo_content), "LINK_UI")
+
+                # Parse and cache the showport data - demo content is static,
+                # so only parse again when it actually changed
+                if demo_content != self._demo_content:
+                    self._demo_link_info = self.link_status_manager.parser.parse_showport_response(demo_content)
+                    self._demo_content = demo_content
+                link_info = self._demo_link_info
                 self.link_status_manager.cached_info = link_info
                 self.link_status_manager.last_refresh = datetime.now()
 
@@ -629,23 +703,9 @@ class LinkStatusDashboardUI:
 
     def _load_demo_showport_file(self) -> Optional[str]:
         """Load showport.txt from DemoData directory"""
-        demo_paths = [
-            "DemoData/showport.txt",
-            "./DemoData/showport.txt",
-            "../DemoData/showport.txt",
-            os.path.join(os.path.dirname(__file__), "DemoData", "showport.txt"),
-            os.path.join(os.getcwd(), "DemoData", "showport.txt")
-        ]
-
-        for path in demo_paths:
-            if os.path.exists(path):
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    debug_info(f"Loaded showport.txt from {path} ({len(content)} chars)", "LINK_UI")
-                    return content
-                except Exception as e:
-                    debug_warning(f"Error reading {path}: {e}", "LINK_UI")
+        content = _load_demo_file("showport.txt")
+        if content:
+            return content
 
         debug_warning("showport.txt not found in DemoData directory", "LINK_UI")
         return self._get_fallback_demo_data()
@@ -724,24 +784,7 @@ Cmd>[]"""
 
 def _load_demo_showport_file_standalone():
     """Standalone function to load demo showport file"""
-    demo_paths = [
-        "DemoData/showport.txt",
-        "./DemoData/showport.txt",
-        "../DemoData/showport.txt",
-        os.path.join(os.path.dirname(__file__), "DemoData", "showport.txt"),
-        os.path.join(os.getcwd(), "DemoData", "showport.txt")
-    ]
-
-    for path in demo_paths:
-        if os.path.exists(path):
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                return content
-            except Exception as e:
-                print(f"DEBUG: Error reading {path}: {e}")
-
-    return None
+    return _load_demo_file("showport.txt")
 
 
 # Testing function
@@ -8,8 +8,10 @@ Handles showmode command execution, SBR mode display, and mode changing function
 
 import re
 import time
+import queue
 import threading
 import tkinter as tk
+from contextlib import nullcontext
 from tkinter import ttk, messagebox
 from datetime import datetime
 from dataclasses import dataclass
@@ -17,6 +19,7 @@ from typing import Dict, Optional, Any, List, Tuple
 import os
 from PIL import Image, ImageTk
 
+from Dashboards.refresh_throttle import RefreshThrottleMixin
 
 @dataclass
 class PortStatusInfo:
@@ -114,14 +117,16 @@ class PortStatusManager:
     def _refresh_info(self) -> None:
         """Send showmode command and parse response"""
         try:
-            # Send showmode command
-            showmode_success = self.cli.send_command("showmode")
-            if not showmode_success:
-                self.cached_info = self._get_error_info("Failed to send showmode command")
-                return
+            # Keep other response_queue readers out until the reply is in
+            with getattr(self.cli, 'exchange_lock', None) or nullcontext():
+                # Send showmode command
+                showmode_success = self._send_fresh_command("showmode")
+                if not showmode_success:
+                    self.cached_info = self._get_error_info("Failed to send showmode command")
+                    return
 
-            # Wait for showmode response
-            showmode_response = self._wait_for_response("showmode", timeout=5.0)
+                # Wait for showmode response
+                showmode_response = self._wait_for_response("showmode", timeout=5.0)
 
             if showmode_response:
                 # Parse the response
@@ -133,27 +138,53 @@ class PortStatusManager:
         except Exception as e:
             self.cached_info = self._get_error_info(f"Error getting port status info: {str(e)}")
 
+    def _send_fresh_command(self, command: str) -> bool:
+        """Drop stale queued responses, then send command"""
+        drain_responses = getattr(self.cli, 'drain_responses', None)
+        if drain_responses:
+            drain_responses()
+        return self.cli.send_command(command)
+
     def _wait_for_response(self, command: str, timeout: float = 5.0) -> Optional[str]:
         """Wait for command response"""
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         response_parts = []
+        # Each line is lowered once on arrival for the completion checks
+        lowered_parts = []
+
+        # With the background reader running, block on its queue instead of polling
+        reader = getattr(self.cli, 'background_thread', None)
+        response_queue = self.cli.response_queue if reader and reader.is_alive() else None
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            if response_queue is not None:
+                try:
+                    response = response_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            else:
+                response = self.cli.read_response()
 
-        while (time.time() - start_time) < timeout:
-            response = self.cli.read_response()
             if response:
                 response_parts.append(response)
-                if self._is_response_complete(command, response_parts):
+                lowered_parts.append(response.lower())
+                if self._is_response_complete(command, lowered_parts):
                     return '\n'.join(response_parts)
-            time.sleep(0.1)
+            elif response_queue is None:
+                time.sleep(0.1)
 
         return '\n'.join(response_parts) if response_parts else None
 
-    def _is_response_complete(self, command: str, response_parts: List[str]) -> bool:
-        """Check if command response appears complete"""
-        if not response_parts:
+    def _is_response_complete(self, command: str, lowered_parts: List[str]) -> bool:
+        """Check if command response appears complete, given its lines already lowercased"""
+        if not lowered_parts:
             return False
 
-        full_response = '\n'.join(response_parts).lower()
+        full_response = '\n'.join(lowered_parts)
 
         # Command-specific completion checks
         if command == "showmode":
@@ -166,8 +197,8 @@ class PortStatusManager:
             if indicator in full_response:
                 return True
 
-        if len(response_parts) > 2:
-            last_line = response_parts[-1].strip().lower()
+        if len(lowered_parts) > 2:
+            last_line = lowered_parts[-1].strip()
             if len(last_line) < 10 and ('>' in last_line or '#' in last_line):
                 return True
 
@@ -189,13 +220,17 @@ class PortStatusManager:
         return self.cli.send_command(command)
 
 
-class PortStatusDashboardUI:
+class PortStatusDashboardUI(RefreshThrottleMixin):
     """UI components for the Port Status dashboard"""
 
     def __init__(self, dashboard_app):
         """Initialize with reference to main dashboard app"""
         self.app = dashboard_app
-        self.image_cache = {}  # Cache for loaded images
+        self.image_cache = {}  # Loaded images by filename
+
+        # Refresh throttling state
+        self._init_refresh_throttle()
+        self._refresh_thread = None
 
         # SBR mode options for dropdown
         self.sbr_modes = [
@@ -361,38 +396,16 @@ class PortStatusDashboardUI:
             # Get image filename
             image_filename = f"SBR{mode_number}.png"
 
-            # Try multiple image paths
-            image_paths = [
-                os.path.join("../Images", image_filename),
-                os.path.join("../assets", "Images", image_filename),
-                os.path.join("../DemoData", "Images", image_filename),
-                os.path.join(os.path.dirname(__file__), "Images", image_filename),
-                os.path.join(os.path.dirname(__file__), "assets", "Images", image_filename)
-            ]
-
-            image_loaded = False
-            for image_path in image_paths:
-                if os.path.exists(image_path):
-                    try:
-                        # Load image
-                        if image_path not in self.image_cache:
-                            pil_image = Image.open(image_path)
-                            # Resize for larger display (max 600x450)
-                            pil_image.thumbnail((600, 450), Image.Resampling.LANCZOS)
-                            self.image_cache[image_path] = ImageTk.PhotoImage(pil_image)
-
-                        # Display image with centered alignment
-                        image_label = ttk.Label(self.image_center_frame,
-                                                image=self.image_cache[image_path])
-                        image_label.pack(expand=True, pady=20)
-                        image_loaded = True
-                        break
-
-                    except Exception as e:
-                        print(f"Error loading image {image_path}: {e}")
-                        continue
+            # Reuse the image loaded for this mode before probing the disk again
+            photo = self.image_cache.get(image_filename)
+            if photo is None:
+                photo = self._load_mode_image(image_filename)
 
-            if not image_loaded:
+            if photo is not None:
+                # Display image with centered alignment
+                image_label = ttk.Label(self.image_center_frame, image=photo)
+                image_label.pack(expand=True, pady=20)
+            else:
                 # Show placeholder if image not found with larger font
                 placeholder_label = ttk.Label(self.image_center_frame,
                                               text=f"📊 SBR{mode_number} Configuration\n(Image not available)",
@@ -410,6 +423,33 @@ class PortStatusDashboardUI:
                                     font=('Arial', 12, 'italic'))
             error_label.pack(expand=True, pady=30)
 
+    def _load_mode_image(self, image_filename: str):
+        """Load and cache a mode image from the first location that has it"""
+        # Try multiple image paths
+        image_paths = [
+            os.path.join("../Images", image_filename),
+            os.path.join("../assets", "Images", image_filename),
+            os.path.join("../DemoData", "Images", image_filename),
+            os.path.join(os.path.dirname(__file__), "Images", image_filename),
+            os.path.join(os.path.dirname(__file__), "assets", "Images", image_filename)
+        ]
+
+        for image_path in image_paths:
+            if os.path.exists(image_path):
+                try:
+                    pil_image = Image.open(image_path)
+                    # Resize for larger display (max 600x450)
+                    pil_image.thumbnail((600, 450), Image.Resampling.LANCZOS)
+                    photo = ImageTk.PhotoImage(pil_image)
+                    self.image_cache[image_filename] = photo
+                    return photo
+
+                except Exception as e:
+                    print(f"Error loading image {image_path}: {e}")
+                    continue
+
+        return None
+
     def create_warning_section(self):
         """Create warning section about power cycling"""
         warning_frame = ttk.Frame(self.app.scrollable_frame, style='Content.TFrame',
@@ -533,25 +573,42 @@ class PortStatusDashboardUI:
 
     def refresh_port_status(self):
         """Refresh port status information"""
+        if self._refresh_throttled(self.refresh_port_status):
+            return
+
+        # showmode can take seconds, so query the device off the Tk thread
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(target=self._refresh_port_status_worker, daemon=True)
+        self._refresh_thread.start()
+
+    def _refresh_port_status_worker(self):
+        """Force a port status refresh and report back on the Tk thread"""
+        error_msg = None
         try:
-            # Force refresh of port status info
-            port_info = self.app.port_status_manager.get_port_status_info(force_refresh=True)
-
-            # Refresh the dashboard display
-            self.app.update_content_area()
+            self.app.port_status_manager.get_port_status_info(force_refresh=True)
+        except Exception as e:
+            error_msg = f"Failed to refresh port status: {str(e)}"
 
-            # Log the refresh action
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            self.app.log_data.append(f"[{timestamp}] Port status refreshed (showmode)")
+        self.app.root.after(0, self._on_port_status_refreshed, error_msg)
 
-        except Exception as e:
+    def _on_port_status_refreshed(self, error_msg: Optional[str]):
+        """Show refreshed port status, or the refresh error"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        if error_msg:
             # Handle any errors during refresh
-            error_msg = f"Failed to refresh port status: {str(e)}"
-            timestamp = datetime.now().strftime('%H:%M:%S')
             self.app.log_data.append(f"[{timestamp}] {error_msg}")
 
             # Show error to user
             messagebox.showerror("Refresh Error", error_msg)
+            return
+
+        # Refresh the dashboard display
+        if self.app.current_dashboard == "port":
+            self.app.update_content_area()
+
+        # Log the refresh action
+        self.app.log_data.append(f"[{timestamp}] Port status refreshed (showmode)")
 
     def change_host_card_mode(self):
         """Handle host card mode change"""
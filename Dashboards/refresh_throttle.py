@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+refresh_throttle.py
+
+Refresh throttling shared by the CalypsoPy dashboard UIs.
+"""
+
+import time
+
+# Minimum time between forced refreshes (seconds)
+MIN_REFRESH_INTERVAL = 0.1
+
+
+class RefreshThrottleMixin:
+    """Drops refresh bursts for dashboard UIs that have an app with a Tk root"""
+
+    def _init_refresh_throttle(self):
+        """Reset refresh throttling state"""
+        self._last_refresh = 0.0
+        self._trailing_refresh_id = None
+
+    def _refresh_throttled(self, refresh) -> bool:
+        """
+        Return True if a refresh ran less than MIN_REFRESH_INTERVAL ago
+
+        A throttled call leaves one trailing refresh scheduled so the
+        final state is still shown.
+        """
+        now = time.monotonic()
+        if now - self._last_refresh < MIN_REFRESH_INTERVAL:
+            if self._trailing_refresh_id is None:
+                self._trailing_refresh_id = self.app.root.after(
+                    int(MIN_REFRESH_INTERVAL * 1000), self._run_trailing_refresh, refresh)
+            return True
+        self._last_refresh = now
+        return False
+
+    def _run_trailing_refresh(self, refresh):
+        """Run the refresh that was held back by _refresh_throttled"""
+        self._trailing_refresh_id = None
+        refresh()
@@ -12,6 +12,39 @@ from datetime import datetime
 from typing import Callable, Optional
 
 
+# Reset operations offered by the dashboard, keyed by reset id
+RESET_COMMANDS = {
+    'msrst': {
+        'name': 'x16 Straddle Mount Reset',
+        'icon': '🔧',
+        'description': 'Reset the x16 Straddle Mount component',
+        'command': 'msrst',
+        'warning_level': 'medium'
+    },
+    'swreset': {
+        'name': 'Atlas 3 Switch Reset',
+        'icon': '🔀',
+        'description': 'Reset the Atlas 3 Switch component',
+        'command': 'swreset',
+        'warning_level': 'medium'
+    },
+    'reset': {
+        'name': 'Full System Reset',
+        'icon': '🔴',
+        'description': 'Perform a complete system reset (will disconnect)',
+        'command': 'reset',
+        'warning_level': 'high'
+    }
+}
+
+# Warning level -> (indicator color, indicator text, button prefix)
+WARNING_STYLES = {
+    'high': ('#ff4444', 'HIGH RISK', '🔴'),
+    'medium': ('#ff9500', 'CAUTION', '🟡'),
+    'low': ('#ffdd44', 'LOW RISK', '🟢'),
+}
+
+
 class ResetsDashboard:
     """
     Resets Dashboard for system reset operations
@@ -27,29 +60,12 @@ class ResetsDashboard:
         self.app = parent_app
         print("DEBUG: ResetsDashboard initialized successfully")
 
-        self.reset_commands = {
-            'msrst': {
-                'name': 'x16 Straddle Mount Reset',
-                'icon': '🔧',
-                'description': 'Reset the x16 Straddle Mount component',
-                'command': 'msrst',
-                'warning_level': 'medium'
-            },
-            'swreset': {
-                'name': 'Atlas 3 Switch Reset',
-                'icon': '🔀',
-                'description': 'Reset the Atlas 3 Switch component',
-                'command': 'swreset',
-                'warning_level': 'medium'
-            },
-            'reset': {
-                'name': 'Full System Reset',
-                'icon': '🔴',
-                'description': 'Perform a complete system reset (will disconnect)',
-                'command': 'reset',
-                'warning_level': 'high'
-            }
-        }
+        # App methods never change after startup, so resolve them once;
+        # cache_manager can be replaced and log_data may be absent, so both are looked up per use
+        self._send_command = getattr(parent_app, 'send_command', None)
+        self._update_cache_status = getattr(parent_app, 'update_cache_status', None)
+
+        self.reset_commands = RESET_COMMANDS
 
     def create_resets_dashboard(self, scrollable_frame):
         """
@@ -221,21 +237,13 @@ class ResetsDashboard:
 
     def _get_warning_style(self, warning_level: str) -> tuple:
         """Get warning color and text based on level"""
-        if warning_level == 'high':
-            return '#ff4444', 'HIGH RISK'
-        elif warning_level == 'medium':
-            return '#ff9500', 'CAUTION'
-        else:
-            return '#ffdd44', 'LOW RISK'
+        color, text, _ = WARNING_STYLES.get(warning_level, WARNING_STYLES['low'])
+        return color, text
 
     def _get_button_text(self, reset_info: dict) -> str:
         """Get button text based on warning level"""
-        if reset_info['warning_level'] == 'high':
-            return f"🔴 Execute {reset_info['name']}"
-        elif reset_info['warning_level'] == 'medium':
-            return f"🟡 Execute {reset_info['name']}"
-        else:
-            return f"🟢 Execute {reset_info['name']}"
+        prefix = WARNING_STYLES.get(reset_info['warning_level'], WARNING_STYLES['low'])[2]
+        return f"{prefix} Execute {reset_info['name']}"
 
     def _execute_reset(self, reset_id: str, reset_info: dict):
         """
@@ -279,16 +287,27 @@ class ResetsDashboard:
         if messagebox.askyesno("Confirm Reset Operation", confirm_message):
             try:
                 # Send the reset command using app's send_command method
-                if hasattr(self.app, 'send_command'):
-                    self.app.send_command(reset_info['command'])
+                if self._send_command:
+                    self._send_command(reset_info['command'])
                     print(f"DEBUG: Sent command: {reset_info['command']}")
 
                     # Log the operation
                     timestamp = datetime.now().strftime('%H:%M:%S')
                     log_message = f"[{timestamp}] Executed {reset_info['name']} ({reset_info['command']})"
 
-                    if hasattr(self.app, 'log_data'):
-                        self.app.log_data.append(log_message)
+                    self._log(log_message)
+
+                    # Clear cache before the modal popup so the status label
+                    # repaints together with it instead of after it closes
+                    cache_manager = getattr(self.app, 'cache_manager', None)
+                    if cache_manager:
+                        # Invalidate relevant cache entries
+                        cache_manager.invalidate_pattern('system')
+                        cache_manager.invalidate_pattern('status')
+
+                        # Update cache status if method exists
+                        if self._update_cache_status:
+                            self._update_cache_status("Cache cleared after reset")
 
                     # Show success message
                     messagebox.showinfo(
@@ -297,16 +316,6 @@ class ResetsDashboard:
                         f"Command '{reset_info['command']}' sent successfully."
                     )
 
-                    # Clear cache if available
-                    if hasattr(self.app, 'cache_manager') and self.app.cache_manager:
-                        # Invalidate relevant cache entries
-                        self.app.cache_manager.invalidate_pattern('system')
-                        self.app.cache_manager.invalidate_pattern('status')
-
-                        # Update cache status if method exists
-                        if hasattr(self.app, 'update_cache_status'):
-                            self.app.update_cache_status("Cache cleared after reset")
-
                 else:
                     print("ERROR: No send_command method found")
                     messagebox.showerror(
@@ -340,22 +349,22 @@ class ResetsDashboard:
         if messagebox.askyesno("⚠️ Confirm Full System Reset", confirm_message):
             try:
                 # Send the reset command
-                if hasattr(self.app, 'send_command'):
-                    self.app.send_command(reset_info['command'])
+                if self._send_command:
+                    self._send_command(reset_info['command'])
                     print(f"DEBUG: Sent full reset command: {reset_info['command']}")
 
                     # Log the operation
                     timestamp = datetime.now().strftime('%H:%M:%S')
                     log_message = f"[{timestamp}] Executed FULL SYSTEM RESET ({reset_info['command']})"
 
-                    if hasattr(self.app, 'log_data'):
-                        self.app.log_data.append(log_message)
+                    self._log(log_message)
 
                     # Clear all cache data
-                    if hasattr(self.app, 'cache_manager') and self.app.cache_manager:
-                        self.app.cache_manager.clear()
-                        if hasattr(self.app, 'update_cache_status'):
-                            self.app.update_cache_status("All cache cleared after full reset")
+                    cache_manager = getattr(self.app, 'cache_manager', None)
+                    if cache_manager:
+                        cache_manager.clear()
+                        if self._update_cache_status:
+                            self._update_cache_status("All cache cleared after full reset")
 
                     # Ask about reconnection
                     self._handle_post_reset_reconnection()
@@ -374,6 +383,12 @@ class ResetsDashboard:
                     f"Failed to execute full system reset:\n{str(e)}"
                 )
 
+    def _log(self, message: str):
+        """Append a message to the app's log if it keeps one"""
+        log_data = getattr(self.app, 'log_data', None)
+        if log_data is not None:
+            log_data.append(message)
+
     def _handle_post_reset_reconnection(self):
         """Handle reconnection options after full system reset"""
         try:
@@ -452,8 +467,7 @@ class ResetsDashboard:
         try:
             # Log application closure
             timestamp = datetime.now().strftime('%H:%M:%S')
-            if hasattr(self.app, 'log_data'):
-                self.app.log_data.append(f"[{timestamp}] Application closing after full system reset")
+            self._log(f"[{timestamp}] Application closing after full system reset")
 
             # Call the app's close handler if it exists
             if hasattr(self.app, 'on_closing'):
@@ -77,6 +77,7 @@ import queue
 import sys
 import os
 import re
+from collections import deque
 from datetime import datetime
 
 # =====================================================================
@@ -138,6 +139,16 @@ except ImportError:
 # =====================================================================
 # UTILITY FUNCTIONS
 # =====================================================================
+# Sidebar tile (frame style, label style) keyed by active state
+TILE_STYLES = {
+    True: ('ActiveTile.TFrame', 'ActiveTile.TLabel'),
+    False: ('Tile.TFrame', 'Tile.TLabel')
+}
+
+# Most recent application log entries kept in memory
+LOG_HISTORY_SIZE = 1000
+
+
 def get_window_title(subtitle="", demo_mode=False):
     """Generate window title with proper branding"""
     base_title = f"{APP_NAME} {APP_VERSION}"
@@ -176,6 +187,10 @@ class SerialCLI:
         self.response_queue = queue.Queue()  # CRITICAL: Required for response handling
         self.log_queue = queue.Queue()
 
+        # Held by a reader for a whole command/response exchange so lines are not
+        # split between dashboards that read response_queue
+        self.exchange_lock = threading.Lock()
+
         # Serial connection configuration
         self.serial_connection = None
         self.baudrate = 115200
@@ -249,18 +264,31 @@ class SerialCLI:
         Returns:
             bool: True if command sent successfully, False otherwise
         """
+        return self.send_commands([command])
+
+    def send_commands(self, commands):
+        """
+        Send several commands to device in a single write
+
+        Args:
+            commands (list): Command strings to send
+
+        Returns:
+            bool: True if all commands were sent, False otherwise
+        """
         if not self.is_running or not self.serial_connection:
             print("WARNING: Cannot send command - not connected")
             return False
 
         try:
-            # Ensure command has proper line ending
-            cmd_with_ending = f"{command.strip()}\r\n"
-            self.serial_connection.write(cmd_with_ending.encode('utf-8'))
-
-            # Log the sent command
-            self.log_queue.put(f"SENT: {command}")
-            print(f"DEBUG: Command sent: {command}")
+            # Ensure every command has proper line ending
+            payload = "".join(f"{command.strip()}\r\n" for command in commands)
+            self.serial_connection.write(payload.encode('utf-8'))
+
+            # Log the sent commands
+            for command in commands:
+                self.log_queue.put(f"SENT: {command}")
+                print(f"DEBUG: Command sent: {command}")
             return True
 
         except serial.SerialException as e:
@@ -274,6 +302,22 @@ class SerialCLI:
             print(f"ERROR: {error_msg}")
             return False
 
+    def drain_responses(self):
+        """
+        Discard queued responses nobody waited for (connect banner, replies
+        to earlier commands) so the next exchange only sees its own lines
+
+        Returns:
+            int: Number of discarded responses
+        """
+        discarded = 0
+        while True:
+            try:
+                self.response_queue.get_nowait()
+            except queue.Empty:
+                return discarded
+            discarded += 1
+
     def read_response(self):
         """
         Read response from device and queue it
@@ -634,7 +678,7 @@ class ConnectionWindow:
         # Disable button and show refreshing state
         self.refresh_btn.config(state='disabled', text="⟳")
         self.port_status_label.config(text="🔄 Scanning for COM ports...")
-        self.root.update()
+        self.root.update_idletasks()
 
         # Store current selection
         current_selection = self.port_var.get()
@@ -686,7 +730,7 @@ class ConnectionWindow:
 
             # Update UI for connection attempt
             self.connect_btn.config(state='disabled', text="Connecting...")
-            self.root.update()
+            self.root.update_idletasks()
 
             # Save demo mode preference
             self.settings_mgr.set('demo', 'enabled_by_default', self.demo_var.get())
@@ -748,6 +792,10 @@ class ConnectionWindow:
             def on_dashboard_close():
                 """Handle dashboard window close event"""
                 try:
+                    # Stop the advanced terminal's sender thread
+                    if getattr(dashboard_app, 'advanced_dashboard', None):
+                        dashboard_app.advanced_dashboard.shutdown()
+
                     # Disconnect from device
                     if hasattr(dashboard_app, 'cli') and dashboard_app.cli:
                         dashboard_app.cli.disconnect()
@@ -865,7 +913,7 @@ class DashboardApp:
         self.settings_mgr = settings_manager
         self.is_demo_mode = (port == "DEMO")
 
-        self.log_data = []
+        self.log_data = deque(maxlen=LOG_HISTORY_SIZE)
 
         # CRITICAL: Initialize all required attributes FIRST
         self.current_dashboard = "host"
@@ -873,6 +921,10 @@ class DashboardApp:
         self.sysinfo_requested = False
         self.showport_requested = False
         self.tile_frames = {}  # Initialize early to prevent errors
+        self._content_update_pending = False
+        self._pending_cache_status = None
+        self._cache_status_scheduled = False
+        self._refresh_after_id = None
 
         print("DEBUG: Basic attributes initialized")
 
@@ -1138,7 +1190,8 @@ class DashboardApp:
         button_group.pack(side='right')
 
         # Cache status indicator (between title and buttons)
-        self.cache_status_label = ttk.Label(self.header_frame, text="",
+        self.cache_status_var = tk.StringVar(value="")
+        self.cache_status_label = ttk.Label(self.header_frame, textvariable=self.cache_status_var,
                                             style='Info.TLabel', font=('Arial', 8))
         self.cache_status_label.pack(side='right', padx=(20, 15))
         print("DEBUG: Cache status label created")
@@ -1150,7 +1203,7 @@ class DashboardApp:
 
         # Refresh button
         self.refresh_btn = ttk.Button(button_group, text="🔄", width=3,
-                                      command=self.refresh_current_dashboard)
+                                      command=self.schedule_dashboard_refresh)
         self.refresh_btn.pack(side='right')
 
         print("DEBUG: Header buttons created and positioned")
@@ -1324,7 +1377,8 @@ class DashboardApp:
             button_group.pack(side='right')
 
             # Cache status indicator
-            self.cache_status_label = ttk.Label(header_frame, text="",
+            self.cache_status_var = tk.StringVar(value="")
+            self.cache_status_label = ttk.Label(header_frame, textvariable=self.cache_status_var,
                                                 style='Info.TLabel', font=('Arial', 8))
             self.cache_status_label.pack(side='right', padx=(20, 10))
 
@@ -1335,7 +1389,7 @@ class DashboardApp:
 
             # Refresh button
             self.refresh_btn = ttk.Button(button_group, text="🔄", width=3,
-                                          command=self.refresh_current_dashboard)
+                                          command=self.schedule_dashboard_refresh)
             self.refresh_btn.pack(side='right')
             print("DEBUG: Header buttons created")
 
@@ -1428,7 +1482,7 @@ class DashboardApp:
                 print("DEBUG: Demo data parsed successfully")
 
                 # Update UI
-                self.root.after_idle(self.update_content_area)
+                self.schedule_content_update()
                 self.update_cache_status("Demo data loaded")
 
                 # Log success
@@ -1478,11 +1532,29 @@ class DashboardApp:
         except Exception as e:
             print(f"ERROR: Failed to update content area: {e}")
 
+    def schedule_content_update(self):
+        """Coalesce content area rebuild requests into a single idle callback"""
+        if self._content_update_pending:
+            return
+        self._content_update_pending = True
+        self.root.after_idle(self._run_scheduled_content_update)
+
+    def _run_scheduled_content_update(self):
+        """Run the pending content area rebuild"""
+        self._content_update_pending = False
+        self.update_content_area()
+
     def update_content_area(self):
         """Update content area based on current dashboard"""
-        # Clear existing content
+        # Clear existing content - the advanced terminal is only hidden so its
+        # widgets and scrollback survive switching dashboards
+        advanced = getattr(self, 'advanced_dashboard', None)
+        retained = advanced.main_frame if advanced else None
         for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+            if widget is retained:
+                widget.pack_forget()
+            else:
+                widget.destroy()
 
         # Update dashboard title
         dashboard_titles = {
@@ -1514,6 +1586,8 @@ class DashboardApp:
                 self.create_resets_dashboard()
             elif self.current_dashboard == "firmware":
                 self.create_firmware_dashboard()
+            elif self.current_dashboard == "advanced":
+                self.create_advanced_dashboard()
             else:
                 # Placeholder for other dashboards
                 self.create_placeholder_dashboard()
@@ -1588,17 +1662,15 @@ class DashboardApp:
 
         try:
             tile = self.tile_frames[dashboard_id]
-            style_prefix = 'ActiveTile' if active else 'Tile'
+            frame_style, label_style = TILE_STYLES[bool(active)]
 
             # Update frame styles
-            for widget_name in ['frame', 'content']:
-                if widget_name in tile and tile[widget_name]:
-                    tile[widget_name].configure(style=f'{style_prefix}.TFrame')
+            tile['frame'].configure(style=frame_style)
+            tile['content'].configure(style=frame_style)
 
             # Update label styles
-            for widget_name in ['icon', 'title']:
-                if widget_name in tile and tile[widget_name]:
-                    tile[widget_name].configure(style=f'{style_prefix}.TLabel')
+            tile['icon'].configure(style=label_style)
+            tile['title'].configure(style=label_style)
 
             print(f"DEBUG: Successfully set {dashboard_id} active={active}")
 
@@ -1781,13 +1853,16 @@ class DashboardApp:
             while getattr(self, 'background_tasks_enabled', False) and self.cli and self.cli.is_running:
                 try:
                     if hasattr(self.cli, 'log_queue'):
-                        log_message = self.cli.log_queue.get(timeout=1.0)
-                        if log_message and hasattr(self, 'log_data'):
-                            self.log_data.append(log_message)
-
-                            # Keep log size manageable
-                            if len(self.log_data) > 1000:
-                                self.log_data = self.log_data[-500:]
+                        log_queue = self.cli.log_queue
+                        batch = [log_queue.get(timeout=1.0)]
+                        # Drain whatever else is already queued so a burst is handled in one pass
+                        while True:
+                            try:
+                                batch.append(log_queue.get_nowait())
+                            except queue.Empty:
+                                break
+                        if hasattr(self, 'log_data'):
+                            self.log_data.extend(message for message in batch if message)
 
                 except queue.Empty:
                     continue
@@ -1845,7 +1920,7 @@ class DashboardApp:
 
                 # Update UI if on host dashboard
                 if self.current_dashboard == "host":
-                    self.root.after_idle(self.update_content_area)
+                    self.schedule_content_update()
 
                 self.update_cache_status("Fresh data loaded")
 
@@ -1860,7 +1935,7 @@ class DashboardApp:
 
                 # Update UI if on port dashboard
                 if self.current_dashboard == "port":
-                    self.root.after_idle(self.update_content_area)
+                    self.schedule_content_update()
 
         except Exception as e:
             print(f"ERROR: Error handling showmode response: {e}")
@@ -1869,6 +1944,17 @@ class DashboardApp:
     # UTILITY METHODS AND UI HELPERS
     # =====================================================================
 
+    def schedule_dashboard_refresh(self):
+        """Collapse a burst of refresh requests into one refresh 50 ms later"""
+        if self._refresh_after_id is not None:
+            return
+        self._refresh_after_id = self.root.after(50, self._run_scheduled_dashboard_refresh)
+
+    def _run_scheduled_dashboard_refresh(self):
+        """Run the pending dashboard refresh"""
+        self._refresh_after_id = None
+        self.refresh_current_dashboard()
+
     def refresh_current_dashboard(self):
         """Refresh the current dashboard"""
         dashboard_name = self.current_dashboard
@@ -1910,7 +1996,18 @@ class DashboardApp:
             print(f"ERROR: Error refreshing {dashboard_name} dashboard: {e}")
 
     def update_cache_status(self, message=""):
-        """Update cache status display"""
+        """Update cache status display, applying only the latest message per idle cycle"""
+        self._pending_cache_status = message
+        if self._cache_status_scheduled:
+            return
+        self._cache_status_scheduled = True
+        self.root.after_idle(self._flush_cache_status)
+
+    def _flush_cache_status(self):
+        """Apply the most recent pending cache status message"""
+        self._cache_status_scheduled = False
+        message = self._pending_cache_status or ""
+
         if not message and self.cache_manager:
             try:
                 stats = self.cache_manager.get_stats()
@@ -1920,7 +2017,9 @@ class DashboardApp:
             except:
                 message = "Cache: Available"
 
-        self.cache_status_label.config(text=message)
+        # Only touch Tk when the text actually changes
+        if self.cache_status_var.get() != message:
+            self.cache_status_var.set(message)
 
         # Clear temporary messages after 3 seconds
         if any(word in message for word in ["Cleared", "Requesting", "Fresh data loaded"]):
@@ -1973,7 +2072,8 @@ class DashboardApp:
             dialog = settings_ui.SettingsDialog(
                 self.root,
                 self.settings_mgr,
-                on_settings_changed=self.on_settings_changed
+                on_settings_changed=self.on_settings_changed,
+                cache_manager=self.cache_manager
             )
         except tk.TclError as e:
             if "geometry manager" in str(e).lower():
@@ -2038,6 +2138,10 @@ class DashboardApp:
                 except Exception as e:
                     print(f"WARNING: Error saving window position: {e}")
 
+            # Stop the advanced terminal's sender thread
+            if getattr(self, 'advanced_dashboard', None):
+                self.advanced_dashboard.shutdown()
+
             # Disconnect from device
             if hasattr(self, 'cli') and self.cli and self.cli.is_running:
                 self.cli.disconnect()